@@ -1,5 +1,18 @@
+from typing import TYPE_CHECKING
+
 from .config import TaskConfig
 from .constants import CONFIG_FILE
-from .ui import TaskApp
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .ui import TaskApp
 
 __all__ = ["TaskConfig", "TaskApp", "CONFIG_FILE"]
+
+
+def __getattr__(name: str):
+    # Importing the UI pulls in PyQt6; defer it until TaskApp is asked for.
+    if name == "TaskApp":
+        from .ui import TaskApp
+
+        return TaskApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
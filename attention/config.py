@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+import copy
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 from .constants import (
@@ -14,21 +16,25 @@ from .constants import (
     DEFAULT_TEXT_COLOR,
     DEFAULT_TRANSPARENCY,
 )
-from .i18n import NO_TASK_VALUES, SUPPORTED_LANGUAGES, strip_pause_prefix
+from .i18n import NO_TASK_VALUES, SUPPORTED_LANGUAGE_SET, strip_pause_prefix
+from .storage import (
+    FileSignature,
+    dumps,
+    file_signature,
+    loads,
+    remember_contents,
+    write_if_changed,
+)
 from .task_state import StoredTask
 
 
+_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}")
+
+
 def is_valid_color(value: str | None) -> bool:
     if not value:
         return False
-    value = str(value).strip()
-    if len(value) != 7 or not value.startswith("#"):
-        return False
-    try:
-        int(value[1:], 16)
-    except ValueError:
-        return False
-    return True
+    return _COLOR_RE.fullmatch(str(value).strip()) is not None
 
 
 def ensure_color(value: str | None, fallback: str) -> str:
@@ -61,17 +67,39 @@ def ensure_language(value: str | None, fallback: str) -> str:
     if not value:
         return fallback
     code = value.lower()
-    return code if code in SUPPORTED_LANGUAGES else fallback
+    return code if code in SUPPORTED_LANGUAGE_SET else fallback
 
 
-def _normalize_time(value: str | None) -> str | None:
+def _parse_hour_minute(value: str) -> tuple[int, int] | None:
+    # Same inputs as strptime("%H:%M"): one or two digits on either side.
+    hour_text, sep, minute_text = value.strip().partition(":")
+    if not sep or not 0 < len(hour_text) <= 2 or not 0 < len(minute_text) <= 2:
+        return None
+    if not (hour_text.isdecimal() and minute_text.isdecimal()):
+        return None
+    hour = int(hour_text)
+    minute = int(minute_text)
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute
+
+
+def normalize_time(value: str | None) -> str | None:
     if not value:
         return None
-    try:
-        dt = datetime.strptime(value.strip(), "%H:%M")
-        return dt.strftime("%H:%M")
-    except ValueError:
+    parsed = _parse_hour_minute(value)
+    if parsed is None:
         return None
+    return f"{parsed[0]:02d}:{parsed[1]:02d}"
+
+
+def time_to_minutes(value: str | None) -> int | None:
+    if not value:
+        return None
+    parsed = _parse_hour_minute(value)
+    if parsed is None:
+        return None
+    return parsed[0] * 60 + parsed[1]
 
 
 def ensure_schedule(value) -> list[dict[str, str]]:
@@ -81,15 +109,13 @@ def ensure_schedule(value) -> list[dict[str, str]]:
     for item in value:
         if not isinstance(item, dict):
             continue
-        start = _normalize_time(item.get("start"))
-        end = _normalize_time(item.get("end"))
+        start = normalize_time(item.get("start"))
+        end = normalize_time(item.get("end"))
         label = str(item.get("label") or "").strip() or "Break"
-        if not start or not end or start == end:
-            continue
-        if start >= end:
+        if not start or not end or start >= end:
             continue
         schedule.append({"start": start, "end": end, "label": label})
-    schedule.sort(key=lambda entry: entry["start"])
+    schedule.sort(key=itemgetter("start"))
     return schedule
 
 
@@ -155,6 +181,18 @@ def ensure_tasks(value) -> list[StoredTask]:
     return tasks
 
 
+# (field, validator, default) for the scalar style fields read by TaskConfig.load.
+_FIELD_VALIDATORS = (
+    ("font_size", ensure_font_size, DEFAULT_FONT_SIZE),
+    ("text_color", ensure_color, DEFAULT_TEXT_COLOR),
+    ("outline_color", ensure_color, DEFAULT_OUTLINE_COLOR),
+    ("transparency", ensure_transparency, DEFAULT_TRANSPARENCY),
+    ("language", ensure_language, DEFAULT_LANGUAGE),
+)
+
+_CONFIG_CACHE: dict[Path, tuple[FileSignature, TaskConfig]] = {}
+
+
 @dataclass
 class TaskConfig:
     message: str = DEFAULT_MESSAGE
@@ -173,11 +211,25 @@ class TaskConfig:
 
     @classmethod
     def load(cls, path: Path) -> "TaskConfig":
-        if not path.exists():
+        signature = file_signature(path)
+        if signature is None:
             return cls()
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+        config = cls._load_uncached(path, signature)
+        _CONFIG_CACHE[path] = (signature, copy.deepcopy(config))
+        return config
+
+    @classmethod
+    def _load_uncached(cls, path: Path, signature: FileSignature) -> "TaskConfig":
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            raw = path.read_bytes()
+            data = loads(raw)
+        except (ValueError, OSError):
+            return cls()
+        remember_contents(path, signature, raw)
+        if not isinstance(data, dict):
             return cls()
         message = str(data.get("message") or "").strip() or DEFAULT_MESSAGE
         x = data.get("x")
@@ -190,15 +242,10 @@ class TaskConfig:
             str(data.get("font_family") or DEFAULT_FONT_FAMILY).strip()
             or DEFAULT_FONT_FAMILY
         )
-        font_size = ensure_font_size(data.get("font_size"), DEFAULT_FONT_SIZE)
-        text_color = ensure_color(data.get("text_color"), DEFAULT_TEXT_COLOR)
-        outline_color = ensure_color(
-            data.get("outline_color"), DEFAULT_OUTLINE_COLOR
-        )
-        transparency = ensure_transparency(
-            data.get("transparency"), DEFAULT_TRANSPARENCY
-        )
-        language = ensure_language(data.get("language"), DEFAULT_LANGUAGE)
+        validated = {
+            name: validate(data.get(name), default)
+            for name, validate, default in _FIELD_VALIDATORS
+        }
         autostart = data.get("autostart")
         if not isinstance(autostart, bool):
             autostart = False
@@ -214,7 +261,7 @@ class TaskConfig:
             if legacy_message and legacy_message not in {DEFAULT_MESSAGE, *NO_TASK_VALUES}:
                 migrated_task = StoredTask(
                     title=legacy_message,
-                    text_color=text_color,
+                    text_color=validated["text_color"],
                 )
                 tasks = [migrated_task]
                 current_task_id = migrated_task.id
@@ -223,33 +270,51 @@ class TaskConfig:
             x=x,
             y=y,
             font_family=font_family,
-            font_size=font_size,
-            text_color=text_color,
-            outline_color=outline_color,
-            transparency=transparency,
-            language=language,
             autostart=autostart,
             schedule=schedule,
             tasks=tasks,
             current_task_id=current_task_id,
+            **validated,
         )
 
     def save(self, path: Path) -> None:
-        data = asdict(self)
-        data["tasks"] = [
-            {
-                "id": task.id,
-                "title": task.title,
-                "estimate_minutes": task.estimate_minutes,
-                "active": task.active,
-                "paused": task.paused,
-                "start_time": task.start_time.isoformat() if task.start_time else None,
-                "elapsed_before_pause_seconds": task.elapsed_before_pause_seconds,
-                "text_color": task.text_color,
-            }
-            for task in self.tasks
-        ]
-        path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        write_config(path, self.encode())
+
+    def encode(self) -> bytes:
+        """Serialize the config to the bytes that ``save`` writes."""
+        # Built by hand: asdict() would deep-copy every field, including the
+        # task list that is replaced with its JSON form below anyway.
+        data = {
+            "message": self.message,
+            "x": self.x,
+            "y": self.y,
+            "font_family": self.font_family,
+            "font_size": self.font_size,
+            "text_color": self.text_color,
+            "outline_color": self.outline_color,
+            "transparency": self.transparency,
+            "language": self.language,
+            "autostart": self.autostart,
+            "schedule": self.schedule,
+            "tasks": [
+                {
+                    "id": task.id,
+                    "title": task.title,
+                    "estimate_minutes": task.estimate_minutes,
+                    "active": task.active,
+                    "paused": task.paused,
+                    "start_time": task.start_time.isoformat() if task.start_time else None,
+                    "elapsed_before_pause_seconds": task.elapsed_before_pause_seconds,
+                    "text_color": task.text_color,
+                }
+                for task in self.tasks
+            ],
+            "current_task_id": self.current_task_id,
+        }
+        return dumps(data, indent=True)
+
+
+def write_config(path: Path, data: bytes) -> None:
+    """Write encoded config *data* to *path*; safe to call off the UI thread."""
+    if write_if_changed(path, data):
+        _CONFIG_CACHE.pop(path, None)
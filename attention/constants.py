@@ -1,6 +1,10 @@
+import sys
 from pathlib import Path
 
+IS_WINDOWS = sys.platform.startswith("win")
+
 CONFIG_FILE = Path("config.json")
+ICON_FILE = Path(__file__).resolve().parent.parent / "icon.png"
 TRANSPARENT_COLOR = "#010101"
 
 DEFAULT_MESSAGE = "Set your task..."
@@ -20,4 +24,4 @@ WRAP_LENGTH = 600
 PADDING = 16
 TIME_GAP = 8
 
-HISTORY_FILE = Path("task_history.json")
+HISTORY_FILE = Path("task_history.jsonl")
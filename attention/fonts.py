@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+try:  # pragma: no cover - import guard to allow headless testing
+    from PyQt6 import QtGui
+except Exception:  # pragma: no cover - handled by the UI modules
+    QtGui = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=64)
+def get_font(family: str, size: int, bold: bool = False) -> QtGui.QFont:
+    """Return a shared font for *family*/*size*/*bold*.
+
+    Callers must not modify the returned font; ``setFont`` takes a copy.
+    """
+    font = QtGui.QFont(family, size)
+    if bold:
+        font.setWeight(QtGui.QFont.Weight.Bold)
+    return font
@@ -1,17 +1,53 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import atexit
+import logging
+import mmap
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from .constants import HISTORY_FILE
+from .storage import FileSignature, dumps, file_signature, loads, write_if_changed
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+_log = logging.getLogger(__name__)
 
-@dataclass
+# Every line we write starts with its date key, so dates can be listed
+# without decoding whole records.
+_DATE_PREFIX_RE = re.compile(rb'\{\s*"date"\s*:\s*"([^"\\]*)"')
+
+_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+_today_text = ""
+_today_expires_at = 0.0
+
+# Appends are buffered and written in batches: after FLUSH_THRESHOLD
+# events or FLUSH_INTERVAL_SECONDS, whichever comes first, and at exit.
+FLUSH_THRESHOLD = 8
+FLUSH_INTERVAL_SECONDS = 2.0
+# While writes keep failing, the timer backs off up to this delay and only
+# the newest MAX_PENDING_RECORDS records per file are kept in memory.
+FLUSH_MAX_BACKOFF_SECONDS = 300.0
+MAX_PENDING_RECORDS = 1000
+_pending: dict[Path, list[bytes]] = {}
+_pending_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+_flush_failures = 0
+# Paths already checked for the legacy format; guarded by _flush_lock.
+_MIGRATED: set[Path] = set()
+
+_HISTORY_CACHE: dict[Path, tuple[FileSignature, dict[str, List[TaskRecord]]]] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class TaskRecord:
     timestamp: str
     event: str
@@ -19,15 +55,75 @@ class TaskRecord:
 
     @classmethod
     def create(cls, event: str, title: str) -> "TaskRecord":
-        return cls(datetime.now().strftime(ISO_FORMAT), event, title)
+        return cls(_timestamp_now(), event, title)
 
 
-def load_history(path: Path = HISTORY_FILE) -> dict[str, List[TaskRecord]]:
-    if not path.exists():
-        return {}
+def _timestamp_now() -> str:
+    # Equivalent to datetime.now().strftime(ISO_FORMAT) without the format parse.
+    now = time.localtime()
+    return (
+        f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+        f"T{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+    )
+
+
+def time_of_day(timestamp: str) -> str:
+    """Return the ``HH:MM:SS`` part of an ISO_FORMAT timestamp, or it unchanged."""
+    if _ISO_RE.match(timestamp):
+        return timestamp[11:19]
+    return timestamp
+
+
+def _today() -> str:
+    """Return today's ``YYYY-MM-DD`` key, recomputed only after local midnight."""
+    global _today_text, _today_expires_at
+    now = time.time()
+    if now < _today_expires_at:
+        return _today_text
+    local = time.localtime(now)
+    _today_text = f"{local.tm_year:04d}-{local.tm_mon:02d}-{local.tm_mday:02d}"
+    # mktime normalizes day overflow and accounts for DST-length days.
+    _today_expires_at = time.mktime(
+        (local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+    )
+    return _today_text
+
+
+def _encode_line(date_key: str, record: TaskRecord) -> bytes:
+    item = {
+        "date": date_key,
+        "timestamp": record.timestamp,
+        "event": record.event,
+        "title": record.title,
+    }
+    return dumps(item) + b"\n"
+
+
+def _decode_line(line: bytes) -> tuple[str, TaskRecord] | None:
+    line = line.strip()
+    if not line:
+        return None
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        item = loads(line)
+    except ValueError:
+        return None
+    if not isinstance(item, dict):
+        return None
+    date_key = item.get("date")
+    timestamp = item.get("timestamp")
+    event = item.get("event")
+    title = item.get("title", "")
+    if not (isinstance(date_key, str) and isinstance(timestamp, str) and isinstance(event, str)):
+        return None
+    return date_key, TaskRecord(timestamp, event, title)
+
+
+def _read_legacy_history(path: Path) -> dict[str, List[TaskRecord]]:
+    try:
+        raw = loads(path.read_bytes())
+    except (ValueError, OSError):
+        return {}
+    if not isinstance(raw, dict):
         return {}
     history: dict[str, List[TaskRecord]] = {}
     for date_key, records in raw.items():
@@ -41,21 +137,260 @@ def load_history(path: Path = HISTORY_FILE) -> dict[str, List[TaskRecord]]:
             event = item.get("event")
             title = item.get("title", "")
             if isinstance(timestamp, str) and isinstance(event, str):
-                parsed.append(TaskRecord(timestamp=timestamp, event=event, title=title))
+                parsed.append(TaskRecord(timestamp, event, title))
         if parsed:
             history[date_key] = parsed
     return history
 
 
+def _is_legacy_format(path: Path) -> bool:
+    # Legacy files are a single indented JSON object; JSONL records never
+    # put an opening brace on a line of its own.
+    try:
+        with path.open("rb") as handle:
+            first_line = handle.readline().strip()
+    except OSError:
+        return False
+    return first_line in (b"{", b"{}")
+
+
+def _migrate_legacy_history(path: Path) -> None:
+    """Rewrite the old nested ``{date: [records]}`` file as JSONL, once per path.
+
+    Callers must hold ``_flush_lock``.
+    """
+    if path in _MIGRATED:
+        return
+    if path.exists():
+        source = path if _is_legacy_format(path) else None
+    else:
+        source = path.with_suffix(".json")
+        if source == path or not source.exists():
+            source = None
+    if source is not None:
+        save_history(_read_legacy_history(source), path)
+    _MIGRATED.add(path)
+
+
+def load_history(path: Path = HISTORY_FILE) -> dict[str, List[TaskRecord]]:
+    flush_pending(path)
+    signature = file_signature(path)
+    if signature is None:
+        return {}
+    cached = _HISTORY_CACHE.get(path)
+    if cached is None or cached[0] != signature:
+        cached = (signature, _read_history(path))
+        _HISTORY_CACHE[path] = cached
+    return {date_key: list(records) for date_key, records in cached[1].items()}
+
+
+def _read_history(path: Path) -> dict[str, List[TaskRecord]]:
+    history: defaultdict[str, List[TaskRecord]] = defaultdict(list)
+    try:
+        for line in _iter_lines(path):
+            parsed = _decode_line(line)
+            if parsed is None:
+                continue
+            date_key, record = parsed
+            history[date_key].append(record)
+    except OSError:
+        return {}
+    return dict(history)
+
+
+def _iter_lines(path: Path) -> Iterator[bytes]:
+    """Yield raw lines of *path* from a read-only memory map."""
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with mapped:
+            size = len(mapped)
+            start = 0
+            while start < size:
+                end = mapped.find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield mapped[start:end]
+                start = end + 1
+
+
+@dataclass
+class _DayIndex:
+    """What the history dialog has read from one file version."""
+
+    signature: FileSignature
+    dates: list[str] | None = None
+    days: dict[str, List[TaskRecord]] = field(default_factory=dict)
+
+
+_DAY_INDEX: dict[Path, _DayIndex] = {}
+
+
+def _day_index(path: Path) -> _DayIndex | None:
+    flush_pending(path)
+    signature = file_signature(path)
+    if signature is None:
+        _DAY_INDEX.pop(path, None)
+        return None
+    index = _DAY_INDEX.get(path)
+    if index is None or index.signature != signature:
+        index = _DAY_INDEX[path] = _DayIndex(signature)
+    return index
+
+
+def history_dates(path: Path = HISTORY_FILE) -> list[str]:
+    """Return the dates that have records, newest first."""
+    index = _day_index(path)
+    if index is None:
+        return []
+    if index.dates is None:
+        index.dates = _scan_dates(path)
+    return list(index.dates)
+
+
+def _scan_dates(path: Path) -> list[str]:
+    dates: set[str] = set()
+    try:
+        for line in _iter_lines(path):
+            match = _DATE_PREFIX_RE.match(line)
+            if match is not None:
+                dates.add(match.group(1).decode("utf-8", "replace"))
+                continue
+            parsed = _decode_line(line)
+            if parsed is not None:
+                dates.add(parsed[0])
+    except OSError:
+        return []
+    return sorted(dates, reverse=True)
+
+
+def load_records_for_date(date_key: str, path: Path = HISTORY_FILE) -> List[TaskRecord]:
+    """Return *date_key*'s records, decoding only the lines that mention it."""
+    index = _day_index(path)
+    if index is None:
+        return []
+    records = index.days.get(date_key)
+    if records is None:
+        records = index.days[date_key] = _scan_date(path, date_key)
+    return list(records)
+
+
+def _scan_date(path: Path, date_key: str) -> List[TaskRecord]:
+    needle = date_key.encode("utf-8")
+    records: List[TaskRecord] = []
+    try:
+        for line in _iter_lines(path):
+            if needle not in line:
+                continue
+            parsed = _decode_line(line)
+            if parsed is not None and parsed[0] == date_key:
+                records.append(parsed[1])
+    except OSError:
+        return []
+    return records
+
+
 def save_history(history: dict[str, List[TaskRecord]], path: Path = HISTORY_FILE) -> None:
-    serializable = {
-        date: [asdict(record) for record in records] for date, records in history.items()
-    }
-    path.write_text(json.dumps(serializable, ensure_ascii=False, indent=2), encoding="utf-8")
+    payload = b"".join(
+        _encode_line(date_key, record)
+        for date_key, records in history.items()
+        for record in records
+    )
+    if write_if_changed(path, payload):
+        _HISTORY_CACHE.pop(path, None)
 
 
 def append_record(record: TaskRecord, path: Path = HISTORY_FILE) -> None:
-    history = load_history(path)
-    today = datetime.now().strftime("%Y-%m-%d")
-    history.setdefault(today, []).append(record)
-    save_history(history, path)
+    line = _encode_line(_today(), record)
+    with _pending_lock:
+        lines = _pending.setdefault(path, [])
+        lines.append(line)
+        # Leave retries to the backing-off timer while writes are failing.
+        flush_now = len(lines) >= FLUSH_THRESHOLD and not _flush_failures
+    if flush_now:
+        flush_pending(path)
+    else:
+        _schedule_flush()
+
+
+def flush_pending(path: Path | None = None) -> None:
+    """Write buffered records for *path* (or every path) with one append and fsync."""
+    with _flush_lock:
+        if path is not None:
+            _migrate_legacy_history(path)
+        with _pending_lock:
+            if path is None:
+                batches = dict(_pending)
+                _pending.clear()
+            else:
+                lines = _pending.pop(path, None)
+                batches = {path: lines} if lines else {}
+        error: OSError | None = None
+        for target, lines in batches.items():
+            try:
+                _migrate_legacy_history(target)
+                with target.open("ab") as handle:
+                    handle.writelines(lines)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            except OSError as exc:
+                with _pending_lock:
+                    kept = lines + _pending.get(target, [])
+                    dropped = len(kept) - MAX_PENDING_RECORDS
+                    _pending[target] = kept[-MAX_PENDING_RECORDS:]
+                if dropped > 0:
+                    _log.warning(
+                        "Dropped %d unwritten task history records for %s", dropped, target
+                    )
+                error = error or exc
+        if error is not None:
+            raise error
+
+
+def _schedule_flush(delay: float | None = None) -> None:
+    global _flush_timer
+    with _pending_lock:
+        if _flush_timer is not None:
+            return
+        _flush_timer = threading.Timer(
+            FLUSH_INTERVAL_SECONDS if delay is None else delay, _timed_flush
+        )
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _timed_flush() -> None:
+    global _flush_timer, _flush_failures
+    # Cleared before flushing, so records appended while the flush runs
+    # schedule a timer of their own.
+    with _pending_lock:
+        _flush_timer = None
+    try:
+        flush_pending()
+    except OSError:
+        # Log once per failure streak, then retry with exponential backoff.
+        if not _flush_failures:
+            _log.exception("Failed to write buffered task history; retrying")
+        _flush_failures += 1
+        delay = min(FLUSH_INTERVAL_SECONDS * 2**_flush_failures, FLUSH_MAX_BACKOFF_SECONDS)
+    else:
+        if _flush_failures:
+            _log.info("Buffered task history written after %d failed attempts", _flush_failures)
+        _flush_failures = 0
+        delay = FLUSH_INTERVAL_SECONDS
+    with _pending_lock:
+        retry = bool(_pending)
+    if retry:
+        _schedule_flush(delay)
+
+
+def _flush_at_exit() -> None:
+    try:
+        flush_pending()
+    except OSError:
+        _log.exception("Failed to write buffered task history at exit")
+
+
+atexit.register(_flush_at_exit)
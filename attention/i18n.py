@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .constants import DEFAULT_LANGUAGE
 
@@ -190,23 +191,55 @@ LANG_STRINGS: dict[str, dict[str, str]] = {
 }
 
 SUPPORTED_LANGUAGES = tuple(LANG_STRINGS.keys())
+SUPPORTED_LANGUAGE_SET = frozenset(SUPPORTED_LANGUAGES)
+_STRING_VIEWS: dict[str, Mapping[str, str]] = {
+    language: MappingProxyType(data) for language, data in LANG_STRINGS.items()
+}
 NO_TASK_VALUES = {data["no_task"] for data in LANG_STRINGS.values()}
+_EVENT_PREFIX = "history_event_"
+_EVENT_LABELS: dict[str, Mapping[str, str]] = {
+    language: MappingProxyType(
+        {
+            key[len(_EVENT_PREFIX):]: text
+            for key, text in data.items()
+            if key.startswith(_EVENT_PREFIX)
+        }
+    )
+    for language, data in LANG_STRINGS.items()
+}
+# Keys whose template needs str.format in at least one language.
+_FORMAT_KEYS = frozenset(
+    key for data in LANG_STRINGS.values() for key, template in data.items() if "{" in template
+)
+# Longest first so a prefix that extends another is never cut short.
+_PAUSE_PREFIXES: tuple[tuple[str, int], ...] = tuple(
+    sorted(
+        {(data["pause_prefix"], len(data["pause_prefix"])) for data in LANG_STRINGS.values()},
+        key=lambda item: -item[1],
+    )
+)
+
+
+def get_strings(language: str) -> Mapping[str, str]:
+    """Return a read-only view of *language*'s strings, safe to hold on to."""
+    return _STRING_VIEWS.get(language, _STRING_VIEWS[DEFAULT_LANGUAGE])
 
 
-def get_strings(language: str) -> dict[str, str]:
-    return LANG_STRINGS.get(language, LANG_STRINGS[DEFAULT_LANGUAGE])
+def event_labels(language: str) -> Mapping[str, str]:
+    """Return *language*'s history event names keyed by the raw event, e.g. ``"start"``."""
+    return _EVENT_LABELS.get(language, _EVENT_LABELS[DEFAULT_LANGUAGE])
 
 
 def translate(language: str, key: str, **kwargs: Any) -> str:
-    strings = get_strings(language)
-    template = strings.get(key, key)
-    return template.format(**kwargs)
+    template = get_strings(language).get(key, key)
+    if key in _FORMAT_KEYS:
+        return template.format(**kwargs)
+    return template
 
 
 def strip_pause_prefix(text: str) -> str:
-    for data in LANG_STRINGS.values():
-        prefix = data["pause_prefix"]
+    for prefix, length in _PAUSE_PREFIXES:
         if text.startswith(prefix):
-            return text[len(prefix) :].lstrip()
+            return text[length:].lstrip()
     return text
 
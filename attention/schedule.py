@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import ctypes
-import sys
-from dataclasses import dataclass
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Callable, Iterable, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, NamedTuple, Optional
 
 try:  # pragma: no cover - import guard to allow headless tests
     from PyQt6 import QtCore, QtGui, QtWidgets
@@ -17,18 +17,71 @@ except Exception as exc:  # pragma: no cover - handled at runtime
 else:  # pragma: no cover
     _IMPORT_ERROR = None
 
-from .config import ensure_schedule
+from .config import ensure_schedule, normalize_time, time_to_minutes
+from .constants import IS_WINDOWS
+from .fonts import get_font
+from .workers import UiDispatcher, background_executor
 
 Translator = Callable[[str, object], str] | Callable[[str], str]
 
 
-@dataclass
-class ScheduleEntry:
+@lru_cache(maxsize=1)
+def _lock_workstation_func() -> Callable[[], int]:
+    import ctypes
+
+    return ctypes.windll.user32.LockWorkStation
+
+
+class ScheduleEntry(NamedTuple):
     label: str
     start: str
     end: str
 
 
+def index_schedule(
+    entries: Iterable[ScheduleEntry],
+) -> tuple[list[ScheduleEntry], list[int], list[int]]:
+    """Sort *entries* and precompute their bounds in minutes.
+
+    Returns ``(entries, starts, reach)``. Entries whose times do not parse,
+    or that do not end after they start, are dropped as ``ensure_schedule``
+    drops them. ``reach[i]`` is the latest end among ``entries[0..i]``; it
+    is non-decreasing, so :func:`match_entry` can bisect it.
+    """
+    kept: list[ScheduleEntry] = []
+    starts: list[int] = []
+    reach: list[int] = []
+    latest = -1
+    for entry in sorted(entries, key=attrgetter("start")):
+        start = time_to_minutes(entry.start)
+        end = time_to_minutes(entry.end)
+        if start is None or end is None or start >= end:
+            continue
+        latest = max(latest, end)
+        kept.append(entry)
+        starts.append(start)
+        reach.append(latest)
+    return kept, starts, reach
+
+
+def match_entry(
+    starts: list[int], reach: list[int], minutes: int
+) -> tuple[Optional[int], Optional[int]]:
+    """Return ``(active, upcoming)`` indexes into the entries for *minutes*.
+
+    *active* is the first entry running at *minutes* (ends are exclusive);
+    when none is, *upcoming* is the next entry to start. The other value is
+    None, and both are None once the last entry has started and ended.
+    """
+    upcoming = bisect_right(starts, minutes)
+    index = bisect_right(reach, minutes)
+    if index < upcoming:
+        return index, None
+    if upcoming < len(starts):
+        return None, upcoming
+    return None, None
+
+
 if QtWidgets is None:
     # Placeholders for test environments without Qt
     class ScheduleOverlay:  # pragma: no cover - not used without Qt
@@ -37,6 +90,41 @@ if QtWidgets is None:
     class ScheduleManagerDialog:  # pragma: no cover - not used without Qt
         ...
 else:
+    class OverlayText(QtWidgets.QWidget):
+        """Single centered line that repaints on change without a relayout.
+
+        The size hint comes from a template string, so updating the text
+        (e.g. every clock second) never invalidates the overlay's layout.
+        """
+
+        def __init__(self, template: str, parent: QtWidgets.QWidget | None = None) -> None:
+            super().__init__(parent)
+            self._text = ""
+            self._template = template
+
+        def text(self) -> str:
+            return self._text
+
+        def setText(self, text: str) -> None:  # noqa: N802
+            if text != self._text:
+                self._text = text
+                self.update()
+
+        def set_template(self, template: str) -> None:
+            if template != self._template:
+                self._template = template
+                self.updateGeometry()
+
+        def sizeHint(self) -> QtCore.QSize:  # noqa: N802
+            metrics = self.fontMetrics()
+            return QtCore.QSize(metrics.horizontalAdvance(self._template), metrics.height())
+
+        def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
+            painter = QtGui.QPainter(self)
+            painter.setPen(self.palette().color(QtGui.QPalette.ColorRole.WindowText))
+            painter.drawText(self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, self._text)
+            painter.end()
+
     class ScheduleOverlay(QtWidgets.QDialog):
         def __init__(
             self,
@@ -47,8 +135,11 @@ else:
         ) -> None:
             super().__init__(parent)
             self.translator = translator
-            self.setWindowFlag(QtCore.Qt.WindowType.FramelessWindowHint)
-            self.setWindowFlag(QtCore.Qt.WindowType.WindowStaysOnTopHint)
+            self.setWindowFlags(
+                self.windowFlags()
+                | QtCore.Qt.WindowType.FramelessWindowHint
+                | QtCore.Qt.WindowType.WindowStaysOnTopHint
+            )
             self.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose, False)
             self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground, False)
             self.setModal(False)
@@ -58,32 +149,35 @@ else:
             focus_size = max(36, base_size * 2)
             schedule_size = max(22, base_size + 6)
 
-            self._time_label = QtWidgets.QLabel()
-            self._time_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self._time_label.setFont(
-                QtGui.QFont(font_family, time_size, QtGui.QFont.Weight.Bold)
-            )
+            self._time_label = OverlayText("00:00:00")
+            self._time_label.setFont(get_font(font_family, time_size, bold=True))
 
             self._current_label = QtWidgets.QLabel()
             self._current_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
             self._current_label.setWordWrap(True)
-            self._current_label.setFont(
-                QtGui.QFont(font_family, focus_size, QtGui.QFont.Weight.Bold)
-            )
+            self._current_label.setFont(get_font(font_family, focus_size, bold=True))
+
+            self._remaining_label = OverlayText("")
+            self._remaining_label.setFont(get_font(font_family, focus_size, bold=True))
 
             self._schedule_label = QtWidgets.QLabel()
             self._schedule_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
             self._schedule_label.setWordWrap(True)
-            self._schedule_label.setFont(QtGui.QFont(font_family, schedule_size))
+            self._schedule_label.setFont(get_font(font_family, schedule_size))
 
             layout = QtWidgets.QVBoxLayout()
             layout.setContentsMargins(60, 60, 60, 60)
             layout.addWidget(self._time_label)
             layout.addSpacing(20)
             layout.addWidget(self._current_label)
+            layout.addWidget(self._remaining_label)
             layout.addSpacing(20)
             layout.addWidget(self._schedule_label, 1)
             self.setLayout(layout)
+            self._current: ScheduleEntry | None = None
+            self._current_end_minutes: int | None = None
+            self._last_remaining: str | None = None
+            self._content_key: tuple[int, int] | None = None
 
         def update_content(
             self,
@@ -92,18 +186,45 @@ else:
             next_entry: ScheduleEntry | None,
             entries: list[ScheduleEntry],
             active_index: int,
+            revision: int,
         ) -> None:
-            self._time_label.setText(now.strftime("%H:%M:%S"))
-            current_text = self.translator(
-                "overlay_current",
-                label=current.label,
-                start=current.start,
-                end=current.end,
+            # The entry texts only change when the active entry or the
+            # schedule itself does; every other call just moves the clock.
+            content_key = (active_index, revision)
+            if content_key != self._content_key:
+                self._content_key = content_key
+                self._current = current
+                self._current_end_minutes = time_to_minutes(current.end)
+                self._last_remaining = None
+                self._remaining_label.set_template(
+                    self.translator("overlay_remaining", time="00:00:00")
+                )
+                self._set_static_text(current, next_entry, entries, active_index)
+            self.update_clock(now)
+            self.ensure_visible()
+
+        def ensure_visible(self) -> None:
+            """Bring the overlay back if it was dismissed (Esc, Alt+F4)."""
+            if not self.isVisible():
+                self.showFullScreen()
+                self.raise_()
+                self.activateWindow()
+
+        def _set_static_text(
+            self,
+            current: ScheduleEntry,
+            next_entry: ScheduleEntry | None,
+            entries: list[ScheduleEntry],
+            active_index: int,
+        ) -> None:
+            self._current_label.setText(
+                self.translator(
+                    "overlay_current",
+                    label=current.label,
+                    start=current.start,
+                    end=current.end,
+                )
             )
-            remaining = self._format_remaining(now, current.end)
-            remaining_line = self.translator("overlay_remaining", time=remaining)
-            self._current_label.setText(f"{current_text}\n{remaining_line}")
-
             lines = [self.translator("overlay_schedule_title")]
             for idx, entry in enumerate(entries):
                 prefix = "> " if idx == active_index else "  "
@@ -118,21 +239,25 @@ else:
                     )
                 )
             self._schedule_label.setText("\n".join(lines))
-            self.showFullScreen()
-            self.raise_()
-            self.activateWindow()
-
-        def _format_remaining(self, now: datetime, end: str) -> str:
-            try:
-                end_time = datetime.strptime(end, "%H:%M").time()
-            except ValueError:
+
+        def update_clock(self, now: datetime) -> None:
+            """Refresh only the clock and the remaining-time line."""
+            self._time_label.setText(now.strftime("%H:%M:%S"))
+            if self._current is None:
+                return
+            remaining = self._format_remaining(now, self._current_end_minutes)
+            if remaining != self._last_remaining:
+                self._last_remaining = remaining
+                self._remaining_label.setText(self.translator("overlay_remaining", time=remaining))
+
+        @staticmethod
+        def _format_remaining(now: datetime, end_minutes: int | None) -> str:
+            if end_minutes is None:
                 return "00:00"
-            end_dt = now.replace(
-                hour=end_time.hour, minute=end_time.minute, second=0, microsecond=0
-            )
-            if end_dt < now:
-                end_dt += timedelta(days=1)
-            total_seconds = max(0, int((end_dt - now).total_seconds()))
+            now_seconds = now.hour * 3600 + now.minute * 60 + now.second
+            total_seconds = end_minutes * 60 - now_seconds
+            if total_seconds < 0:
+                total_seconds += 86400
             hours, remainder = divmod(total_seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
             if hours:
@@ -174,9 +299,16 @@ if QtWidgets is not None:
             self._refresh_list()
 
         def _refresh_list(self) -> None:
-            self._list.clear()
-            for entry in self.entries:
-                self._list.addItem(f"{entry.start} - {entry.end}  {entry.label}")
+            # Touch only the rows whose text changed, then trim the tail.
+            texts = [f"{entry.start} - {entry.end}  {entry.label}" for entry in self.entries]
+            for row, text in enumerate(texts):
+                item = self._list.item(row)
+                if item is None:
+                    self._list.addItem(text)
+                elif item.text() != text:
+                    item.setText(text)
+            while self._list.count() > len(texts):
+                self._list.takeItem(self._list.count() - 1)
 
         def _edit_selected(self) -> None:
             row = self._list.currentRow()
@@ -264,18 +396,10 @@ if QtWidgets is not None:
             self._refresh_list()
 
         def _normalize_time(self, value: str) -> str | None:
-            try:
-                dt = datetime.strptime(value.strip(), "%H:%M")
-                return dt.strftime("%H:%M")
-            except ValueError:
-                return None
+            return normalize_time(value)
 
         def _to_minutes(self, value: str) -> int | None:
-            try:
-                parts = datetime.strptime(value, "%H:%M")
-                return parts.hour * 60 + parts.minute
-            except ValueError:
-                return None
+            return time_to_minutes(value)
 
 
 class ScheduleController(QtCore.QObject):
@@ -296,14 +420,29 @@ class ScheduleController(QtCore.QObject):
         self.font_family = font_family
         self.base_size = base_size
         self.entries = [ScheduleEntry(**entry) for entry in ensure_schedule(list(schedule))]
+        self._starts: list[int] = []
+        self._reach: list[int] = []
+        self._revision = 0
+        self._rebuild_index()
         self._last_lock_marker: tuple[str, str, str] | None = None
         self._last_lock_timestamp: datetime | None = None
         self._last_pre_notice_marker: tuple[str, str, str] | None = None
+        # Entry matching only changes on minute boundaries; the overlay clock
+        # ticks every second on its own timer while the overlay is visible.
         self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._tick)
+        self._clock_timer = QtCore.QTimer(self)
+        self._clock_timer.timeout.connect(self._clock_tick)
         self._overlay: ScheduleOverlay | None = None
+        self._dispatcher = UiDispatcher(self)
 
     def set_font(self, family: str, size: int) -> None:
+        # Settings saves call this unconditionally; keep the overlay (and its
+        # cached fonts) unless the font actually changed.
+        if family == self.font_family and size == self.base_size:
+            return
         self.font_family = family
         self.base_size = size
         if self._overlay:
@@ -313,6 +452,7 @@ class ScheduleController(QtCore.QObject):
     def set_schedule(self, entries: Iterable[dict[str, str]]) -> list[ScheduleEntry]:
         sanitized = ensure_schedule(list(entries))
         self.entries = [ScheduleEntry(**entry) for entry in sanitized]
+        self._rebuild_index()
         self._last_pre_notice_marker = None
         if not self.entries:
             self.hide_overlay()
@@ -324,57 +464,62 @@ class ScheduleController(QtCore.QObject):
             # The dialog does not use accept/reject, so we keep current entries.
             pass
         self.entries = dialog.entries
+        self._rebuild_index()
         if not self.entries:
             self.hide_overlay()
         return self.entries
 
+    def _rebuild_index(self) -> None:
+        """Precompute entry bounds in minutes so ticks never parse times."""
+        self._revision += 1
+        self.entries, self._starts, self._reach = index_schedule(self.entries)
+
     def start(self) -> None:
         if self.entries:
-            self._timer.start(1000)
+            self._timer.start(0)
 
     def stop(self) -> None:
         self._timer.stop()
+        self._clock_timer.stop()
         self.hide_overlay()
         self._last_lock_marker = None
         self._last_lock_timestamp = None
         self._last_pre_notice_marker = None
 
     def hide_overlay(self) -> None:
+        self._clock_timer.stop()
         if self._overlay:
             self._overlay.hide()
         self._overlay = None
 
     def _tick(self) -> None:
+        now = datetime.now()
         if not self.entries:
+            self._schedule_next_tick(now)
             return
-        now = datetime.now()
         minutes = now.hour * 60 + now.minute
         today = now.date().isoformat()
         lock_marker: tuple[str, str, str] | None = None
         overlay_marker: tuple[str, str] | None = None
         pre_notice_marker: tuple[str, str, str] | None = None
-        for index, entry in enumerate(self.entries):
-            start_minutes = self._to_minutes(entry.start)
-            end_minutes = self._to_minutes(entry.end)
-            if start_minutes is None or end_minutes is None:
-                continue
-            if start_minutes <= minutes < end_minutes:
-                lock_marker = (today, entry.start, entry.end)
-                overlay_marker = (entry.start, entry.end)
-                next_entry = self.entries[index + 1] if index + 1 < len(self.entries) else None
-                self._show_overlay(now, entry, next_entry, index)
-                if self._should_lock_again(lock_marker, now):
-                    self._lock_workstation()
-                    self._last_lock_marker = lock_marker
-                    self._last_lock_timestamp = now
-                break
-            if minutes < start_minutes:
-                pre_notice_marker = (today, entry.start, entry.end)
-                if start_minutes - minutes <= 30:
-                    if self._should_notify_pre_lock(pre_notice_marker):
-                        self._notify_pre_lock(entry)
-                        self._last_pre_notice_marker = pre_notice_marker
-                break
+        index, upcoming = match_entry(self._starts, self._reach, minutes)
+        if index is not None:
+            entry = self.entries[index]
+            lock_marker = (today, entry.start, entry.end)
+            overlay_marker = (entry.start, entry.end)
+            next_entry = self.entries[index + 1] if index + 1 < len(self.entries) else None
+            self._show_overlay(now, entry, next_entry, index)
+            if self._should_lock_again(lock_marker, now):
+                self._lock_workstation()
+                self._last_lock_marker = lock_marker
+                self._last_lock_timestamp = now
+        elif upcoming is not None:
+            entry = self.entries[upcoming]
+            pre_notice_marker = (today, entry.start, entry.end)
+            if self._starts[upcoming] - minutes <= 30:
+                if self._should_notify_pre_lock(pre_notice_marker):
+                    self._notify_pre_lock(entry)
+                    self._last_pre_notice_marker = pre_notice_marker
         if overlay_marker is None:
             self.hide_overlay()
         if lock_marker is None:
@@ -382,6 +527,23 @@ class ScheduleController(QtCore.QObject):
             self._last_lock_timestamp = None
         if pre_notice_marker is None:
             self._last_pre_notice_marker = None
+        self._schedule_next_tick(now)
+
+    def _schedule_next_tick(self, now: datetime) -> None:
+        ms_until_next_minute = (60 - now.second) * 1000 - now.microsecond // 1000
+        self._timer.start(max(1, ms_until_next_minute))
+
+    def _clock_tick(self) -> None:
+        if self._overlay is None:
+            self._clock_timer.stop()
+            return
+        now = datetime.now()
+        self._overlay.update_clock(now)
+        self._overlay.ensure_visible()
+        marker = self._last_lock_marker
+        if marker is not None and self._should_lock_again(marker, now):
+            self._lock_workstation()
+            self._last_lock_timestamp = now
 
     def _show_overlay(
         self, now: datetime, entry: ScheduleEntry, next_entry: ScheduleEntry | None, index: int
@@ -393,19 +555,29 @@ class ScheduleController(QtCore.QObject):
             parent=self.parent(),
         )
         self._overlay = overlay
-        overlay.update_content(now, entry, next_entry, self.entries, index)
+        overlay.update_content(now, entry, next_entry, self.entries, index, self._revision)
+        if not self._clock_timer.isActive():
+            self._clock_timer.start(1000)
 
     def _lock_workstation(self) -> None:
-        if not sys.platform.startswith("win"):
+        if not IS_WINDOWS:
             return
+        # LockWorkStation does not touch Qt; run it off the UI thread so the
+        # overlay keeps painting, and report failures back on the UI thread.
+        background_executor().submit(self._lock_in_background)
+
+    def _lock_in_background(self) -> None:
         try:
-            ctypes.windll.user32.LockWorkStation()
+            _lock_workstation_func()()
         except Exception:
-            QtWidgets.QMessageBox.critical(
-                self.parent(),
-                self.translator("notice_title"),
-                self.translator("error_lock_failed"),
-            )
+            self._dispatcher.post_latest(self._show_lock_error)
+
+    def _show_lock_error(self) -> None:
+        QtWidgets.QMessageBox.critical(
+            self.parent(),
+            self.translator("notice_title"),
+            self.translator("error_lock_failed"),
+        )
 
     def _should_lock_again(self, marker: tuple[str, str, str], now: datetime) -> bool:
         if self._last_lock_marker != marker:
@@ -429,9 +601,3 @@ class ScheduleController(QtCore.QObject):
             return
         QtWidgets.QMessageBox.information(parent, title, message)
 
-    def _to_minutes(self, value: str) -> int | None:
-        try:
-            parts = datetime.strptime(value, "%H:%M")
-            return parts.hour * 60 + parts.minute
-        except ValueError:
-            return None
@@ -16,6 +16,7 @@ from .config import (
     ensure_font_size,
     ensure_language,
     ensure_transparency,
+    is_valid_color,
 )
 from .i18n import SUPPORTED_LANGUAGES
 
@@ -81,19 +82,42 @@ class SettingsDialog(QtWidgets.QDialog):
     def _open_schedule(self) -> None:
         self.schedule_callback(self)
 
-    def apply_changes(self) -> TaskConfig | None:
-        message = self._text_edit.toPlainText().strip()
-        if not message:
+    def _field_values(self) -> tuple[str, str, str]:
+        return (
+            self._text_edit.toPlainText().strip(),
+            self._text_color_edit.text().strip(),
+            self._outline_color_edit.text().strip(),
+        )
+
+    def _first_error(self) -> str | None:
+        message, text_color, outline_color = self._field_values()
+        # (value, validator, error key), checked in form order.
+        checks = (
+            (message, bool, "error_empty"),
+            (text_color, is_valid_color, "error_invalid_color"),
+            (outline_color, is_valid_color, "error_invalid_color"),
+        )
+        for value, validator, error_key in checks:
+            if not validator(value):
+                return error_key
+        return None
+
+    def accept(self) -> None:
+        error_key = self._first_error()
+        if error_key is not None:
             QtWidgets.QMessageBox.critical(
-                self, self.translator("notice_title"), self.translator("error_empty")
+                self, self.translator("notice_title"), self.translator(error_key)
             )
-            return None
+            return
+        super().accept()
+
+    def apply_changes(self) -> TaskConfig:
+        message, text_color, outline_color = self._field_values()
+        message = message or self.config.message
         font_family = self._font_edit.text().strip() or self.config.font_family
         font_size = ensure_font_size(self._font_size_spin.value(), self.config.font_size)
-        text_color = ensure_color(self._text_color_edit.text().strip(), self.config.text_color)
-        outline_color = ensure_color(
-            self._outline_color_edit.text().strip(), self.config.outline_color
-        )
+        text_color = ensure_color(text_color, self.config.text_color)
+        outline_color = ensure_color(outline_color, self.config.outline_color)
         transparency = ensure_transparency(
             self._transparency_spin.value(), self.config.transparency
         )
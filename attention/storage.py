@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+FileSignature = tuple[int, int]
+
+# path -> (signature, digest) of the contents we last read or wrote there.
+_known_contents: dict[Path, tuple[FileSignature, bytes]] = {}
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    """Return ``(mtime_ns, size)`` for *path*, or ``None`` if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON, optionally pretty-printed with two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling temp file and swap it into place with ``os.replace``."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def remember_contents(path: Path, signature: FileSignature, data: bytes) -> None:
+    """Record that *path* held *data* when it had *signature*."""
+    _known_contents[path] = (signature, _digest(data))
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write *data* unless *path* is known to hold it already.
+
+    Returns ``True`` when the file was written.
+    """
+    digest = _digest(data)
+    known = _known_contents.get(path)
+    if known is not None and known[1] == digest and known[0] == file_signature(path):
+        return False
+    atomic_write_bytes(path, data)
+    signature = file_signature(path)
+    if signature is not None:
+        _known_contents[path] = (signature, digest)
+    return True
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from uuid import uuid4
 
@@ -18,7 +20,43 @@ from .constants import (
     STOP_TEXT_COLOR,
     TIME_TEXT_COLOR,
 )
-from .i18n import strip_pause_prefix, translate
+from .i18n import get_strings, strip_pause_prefix, translate
+
+
+# Fractions of the estimate up to which each color applies; past the last
+# one the task is over its estimate.
+_ESTIMATE_COLOR_STEPS = ((0.5, "#4caf50"), (0.8, "#ffeb3b"), (1.0, "#ff9800"))
+_OVER_ESTIMATE_COLOR = "#ff3b30"
+# Beyond this gap between monotonic and wall-clock running time the wall
+# clock wins: monotonic time stops while the machine sleeps on macOS and
+# Linux, and start_time is what is displayed and persisted.
+_ANCHOR_DRIFT_SECONDS = 5.0
+
+
+@lru_cache(maxsize=32)
+def _estimate_boundaries(est_seconds: int) -> tuple[tuple[float, str], ...]:
+    return tuple((est_seconds * fraction, color) for fraction, color in _ESTIMATE_COLOR_STEPS)
+
+
+def estimate_color(elapsed_seconds: int, est_seconds: int) -> str:
+    for boundary, color in _estimate_boundaries(est_seconds):
+        if elapsed_seconds <= boundary:
+            return color
+    return _OVER_ESTIMATE_COLOR
+
+
+@lru_cache(maxsize=256)
+def elapsed_label(language: str, minutes: int) -> str:
+    """Return the "Elapsed ..." text for whole *minutes* in *language*."""
+    strings = get_strings(language)
+    if minutes < 1:
+        return strings["time_elapsed_less_minute"]
+    if minutes < 60:
+        return strings["time_elapsed_minutes"].format(minutes=minutes)
+    hours, rem = divmod(minutes, 60)
+    if rem == 0:
+        return strings["time_elapsed_hours_only"].format(hours=hours)
+    return strings["time_elapsed_hours"].format(hours=hours, minutes=rem)
 
 
 @dataclass
@@ -60,6 +98,17 @@ class TaskState:
     paused: bool = False
     start_time: Optional[datetime] = None
     elapsed_before_pause: timedelta = field(default_factory=timedelta)
+    # time_text's formatted start time, valid while start_time is unchanged.
+    _start_time_text: tuple[Optional[datetime], str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
+    # time.monotonic() reading that corresponds to start_time, so small
+    # wall-clock adjustments do not make running time jitter. Set by
+    # start()/resume(); re-derived from the wall clock for loaded tasks and
+    # whenever the two clocks drift apart (see _ANCHOR_DRIFT_SECONDS).
+    _monotonic_start: tuple[Optional[datetime], float] = field(
+        default=(None, 0.0), init=False, repr=False, compare=False
+    )
 
     def task_name(self) -> str:
         return strip_pause_prefix(self.message).strip()
@@ -73,6 +122,7 @@ class TaskState:
         self.active = True
         self.paused = False
         self.start_time = datetime.now()
+        self._monotonic_start = (self.start_time, time.monotonic())
         self.elapsed_before_pause = timedelta()
         self.text_color = ACTIVE_TEXT_COLOR
 
@@ -80,7 +130,7 @@ class TaskState:
         if not self.active or self.paused:
             return
         if self.start_time:
-            self.elapsed_before_pause += datetime.now() - self.start_time
+            self.elapsed_before_pause += timedelta(seconds=self._running_seconds())
         self.paused = True
         self.text_color = PAUSE_TEXT_COLOR
         prefix = translate(self.language, "pause_prefix")
@@ -93,6 +143,7 @@ class TaskState:
         self.text_color = ACTIVE_TEXT_COLOR
         self.message = self.task_name()
         self.start_time = datetime.now()
+        self._monotonic_start = (self.start_time, time.monotonic())
 
     def stop(self) -> None:
         self.active = False
@@ -135,52 +186,74 @@ class TaskState:
             text_color=self.text_color,
         )
 
+    def _running_seconds(self) -> float:
+        """Seconds since start_time, on the monotonic clock unless it has drifted."""
+        wall_seconds = (datetime.now() - self.start_time).total_seconds()
+        now = time.monotonic()
+        anchored_for, anchor = self._monotonic_start
+        if (
+            anchored_for != self.start_time
+            or abs(now - anchor - wall_seconds) > _ANCHOR_DRIFT_SECONDS
+        ):
+            anchor = now - wall_seconds
+            self._monotonic_start = (self.start_time, anchor)
+        return now - anchor
+
     def elapsed_seconds(self) -> int:
-        elapsed = self.elapsed_before_pause
+        elapsed = self.elapsed_before_pause.total_seconds()
         if self.active and not self.paused and self.start_time:
-            elapsed += datetime.now() - self.start_time
-        return max(0, int(elapsed.total_seconds()))
+            elapsed += self._running_seconds()
+        return max(0, int(elapsed))
 
+    # The per-tick texts below format the language's templates directly
+    # rather than going through translate().
     def _elapsed_label(self, elapsed_seconds: int) -> str:
-        if elapsed_seconds < 60:
-            return translate(self.language, "time_elapsed_less_minute")
-        minutes = elapsed_seconds // 60
-        if minutes < 60:
-            return translate(self.language, "time_elapsed_minutes", minutes=minutes)
-        hours, rem = divmod(minutes, 60)
-        if rem == 0:
-            return translate(self.language, "time_elapsed_hours_only", hours=hours)
-        return translate(self.language, "time_elapsed_hours", hours=hours, minutes=rem)
+        return elapsed_label(self.language, elapsed_seconds // 60)
 
     def time_text(self) -> str:
         if not self.active or not self.start_time:
             return ""
-        start_label = translate(self.language, "time_started")
-        start_time_str = self.start_time.strftime("%H:%M:%S")
+        start_label = get_strings(self.language)["time_started"]
+        cached_for, start_time_str = self._start_time_text
+        if cached_for != self.start_time:
+            start = self.start_time
+            start_time_str = f"{start.hour:02d}:{start.minute:02d}:{start.second:02d}"
+            self._start_time_text = (start, start_time_str)
         return f"{start_label}: {start_time_str}"
 
+    def seconds_until_text_change(self) -> Optional[int]:
+        """Seconds until estimate_text() next changes, or None while it is frozen."""
+        if not self.active or self.paused or not self.start_time:
+            return None
+        elapsed = self.elapsed_seconds()
+        # The elapsed label moves on at every whole minute.
+        wait = 60 - elapsed % 60
+        if self.estimate_minutes:
+            est_seconds = max(1, self.estimate_minutes * 60)
+            if elapsed < est_seconds:
+                # Colors switch once elapsed passes each boundary.
+                for boundary, _color in _estimate_boundaries(est_seconds):
+                    if elapsed <= boundary:
+                        wait = min(wait, int(boundary) + 1 - elapsed)
+                        break
+            else:
+                # The overrun count steps at est + 1, est + 61, ...
+                wait = min(wait, (est_seconds + 1 - elapsed) % 60 or 60)
+        return wait
+
     def estimate_text(self) -> tuple[str, str]:
         if not self.active or not self.start_time:
             return "", STOP_TEXT_COLOR
-        elapsed_label = self._elapsed_label(self.elapsed_seconds())
+        elapsed = self.elapsed_seconds()
+        elapsed_label = self._elapsed_label(elapsed)
         if not self.estimate_minutes:
             return elapsed_label, TIME_TEXT_COLOR
-        elapsed = self.elapsed_seconds()
         est_seconds = max(1, self.estimate_minutes * 60)
-        ratio = elapsed / est_seconds
-        if ratio <= 0.5:
-            color = "#4caf50"
-        elif ratio <= 0.8:
-            color = "#ffeb3b"
-        elif ratio <= 1.0:
-            color = "#ff9800"
-        else:
-            color = "#ff3b30"
-        if ratio <= 1.0:
-            estimate_text = translate(
-                self.language, "estimate_label", minutes=self.estimate_minutes
-            )
+        color = estimate_color(elapsed, est_seconds)
+        strings = get_strings(self.language)
+        if elapsed <= est_seconds:
+            estimate_text = strings["estimate_label"].format(minutes=self.estimate_minutes)
         else:
             over_min = (elapsed - est_seconds + 59) // 60
-            estimate_text = translate(self.language, "estimate_over_label", minutes=over_min)
+            estimate_text = strings["estimate_over_label"].format(minutes=over_min)
         return f"{elapsed_label} · {estimate_text}", color
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import copy
+import logging
 import os
-import subprocess
 import sys
-from dataclasses import asdict
+import threading
+from collections import OrderedDict
 from datetime import timedelta
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +21,7 @@ else:  # pragma: no cover - only evaluated when Qt is available
 
 QtWidgetBase = QtWidgets.QWidget if QtWidgets is not None else object
 QtDialogBase = QtWidgets.QDialog if QtWidgets is not None else object
+QtLabelBase = QtWidgets.QLabel if QtWidgets is not None else object
 
 from .config import (
     TaskConfig,
@@ -26,6 +29,7 @@ from .config import (
     ensure_font_size,
     ensure_language,
     ensure_transparency,
+    write_config,
 )
 from .constants import (
     CONFIG_FILE,
@@ -36,22 +40,252 @@ from .constants import (
     DEFAULT_OUTLINE_COLOR,
     DEFAULT_TEXT_COLOR,
     DEFAULT_TRANSPARENCY,
+    ICON_FILE,
+    IS_WINDOWS,
     STOP_TEXT_COLOR,
     TIME_TEXT_COLOR,
+    WRAP_LENGTH,
 )
-from .history import TaskRecord, append_record, load_history
-from .i18n import NO_TASK_VALUES, translate
+from .fonts import get_font
+from .history import (
+    TaskRecord,
+    append_record,
+    history_dates,
+    load_records_for_date,
+    time_of_day,
+)
+from .i18n import NO_TASK_VALUES, event_labels, translate
 from .schedule import ScheduleController
-from .settings import SettingsDialog
 from .task_state import StoredTask, TaskState
+from .workers import UiDispatcher, background_executor, shutdown_background_executor
+
+_log = logging.getLogger(__name__)
+
+# Upper bound on memoized TaskApp.tr results; the cache is simply reset
+# when it fills, since the steady-state key set is small.
+_TR_CACHE_LIMIT = 256
+# Wrapped text and size hints of OutlinedLabel, least recently used first.
+_LAYOUT_CACHE: OrderedDict[tuple, tuple[str, QtCore.QSize]] = OrderedDict()
+_LAYOUT_CACHE_LIMIT = 64
+# Quiet period after a drag before the new position is written to disk.
+GEOMETRY_SAVE_DELAY_MS = 1500
+# Fire just after a label boundary rather than just before it.
+LABEL_REFRESH_SLACK_MS = 50
+
+
+def wrap_text(text: str, font: QtGui.QFont, width: int) -> str:
+    """Break *text* into lines no wider than *width*, joined with newlines.
+
+    Uses Qt's own line breaking, the same rules as drawing with
+    ``TextWordWrap``, so CJK text still breaks between characters.
+    """
+    option = QtGui.QTextOption()
+    option.setWrapMode(QtGui.QTextOption.WrapMode.WordWrap)
+    lines: list[str] = []
+    for paragraph in text.split("\n"):
+        layout = QtGui.QTextLayout(paragraph, font)
+        layout.setTextOption(option)
+        # Line positions are UTF-16 offsets; slice the encoded paragraph.
+        encoded = paragraph.encode("utf-16-le")
+        first_line = len(lines)
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            start = line.textStart() * 2
+            end = start + line.textLength() * 2
+            lines.append(encoded[start:end].decode("utf-16-le").rstrip())
+        layout.endLayout()
+        if len(lines) == first_line:
+            lines.append("")
+    return "\n".join(lines)
+
+
+class OutlinedLabel(QtLabelBase):
+    """Word-wrapped label whose text is drawn with a solid outline.
+
+    The outlined text is rasterized once into a pixmap and repainted from
+    it until the text, font, colors or size change.
+    """
+
+    OUTLINE_WIDTH = 2
+
+    def __init__(self, text: str = "", parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(text, parent)
+        self._outline_color = QtGui.QColor(DEFAULT_OUTLINE_COLOR)
+        self._pixmap: QtGui.QPixmap | None = None
+        self._pixmap_key: tuple | None = None
+        self._metrics: QtGui.QFontMetrics | None = None
+        self._metrics_key: str | None = None
+        self._layout: tuple[str, QtCore.QSize] = ("", QtCore.QSize())
+        self._layout_key: tuple | None = None
+        width = self.OUTLINE_WIDTH
+        self.setContentsMargins(width, width, width, width)
+
+    # QLabel's word-wrap size hint searches several widths for a pleasing
+    # aspect ratio on every layout pass, and drawing would wrap the text
+    # again. Wrap once at WRAP_LENGTH instead and share the result.
+    def _text_layout(self) -> tuple[str, QtCore.QSize]:
+        """Return the text with explicit line breaks and its size hint."""
+        font_key = self.font().key()
+        key = (self.text(), font_key, self.alignment().value)
+        if key != self._layout_key:
+            # Shared by all labels, so toggling back to an earlier text
+            # (pause/resume, language switches) is not measured again.
+            layout = _LAYOUT_CACHE.get(key)
+            if layout is None:
+                layout = self._measure()
+                if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_LIMIT:
+                    _LAYOUT_CACHE.popitem(last=False)
+                _LAYOUT_CACHE[key] = layout
+            else:
+                _LAYOUT_CACHE.move_to_end(key)
+            self._layout = layout
+            self._layout_key = key
+        return self._layout
+
+    def _font_metrics(self) -> QtGui.QFontMetrics:
+        font_key = self.font().key()
+        if font_key != self._metrics_key or self._metrics is None:
+            self._metrics = QtGui.QFontMetrics(self.font())
+            self._metrics_key = font_key
+        return self._metrics
+
+    def _measure(self) -> tuple[str, QtCore.QSize]:
+        wrapped = wrap_text(self.text(), self.font(), WRAP_LENGTH)
+        bounds = self._font_metrics().boundingRect(
+            QtCore.QRect(0, 0, 1 << 20, 1 << 20), self.alignment().value, wrapped
+        )
+        margin = 2 * self.OUTLINE_WIDTH
+        return wrapped, QtCore.QSize(bounds.width() + margin, bounds.height() + margin)
 
+    def hasHeightForWidth(self) -> bool:  # noqa: N802
+        return False
 
-def apply_outline_effect(label: QtWidgets.QLabel, color: str) -> None:
-    effect = QtWidgets.QGraphicsDropShadowEffect(label)
-    effect.setBlurRadius(4)
-    effect.setOffset(0, 0)
-    effect.setColor(QtGui.QColor(color))
-    label.setGraphicsEffect(effect)
+    def sizeHint(self) -> QtCore.QSize:  # noqa: N802
+        return QtCore.QSize(self._text_layout()[1])
+
+    def minimumSizeHint(self) -> QtCore.QSize:  # noqa: N802
+        return self.sizeHint()
+
+    def set_outline_color(self, color: str) -> None:
+        qcolor = QtGui.QColor(color)
+        if qcolor == self._outline_color:
+            return
+        self._outline_color = qcolor
+        self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
+        fill = self.palette().color(QtGui.QPalette.ColorRole.WindowText)
+        ratio = self.devicePixelRatioF()
+        key = (
+            self.text(),
+            self.font().key(),
+            fill.rgba(),
+            self._outline_color.rgba(),
+            self.width(),
+            self.height(),
+            ratio,
+        )
+        if key != self._pixmap_key or self._pixmap is None:
+            # Renders are shared through QPixmapCache, so a font or color
+            # switch back to an earlier setting does not rasterize again.
+            cache_key = "outlined-label:" + "|".join(map(str, key))
+            pixmap = QtGui.QPixmapCache.find(cache_key)
+            if pixmap is None:
+                pixmap = self._render(fill, ratio)
+                QtGui.QPixmapCache.insert(cache_key, pixmap)
+            self._pixmap = pixmap
+            self._pixmap_key = key
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    def _render(self, fill: QtGui.QColor, ratio: float) -> QtGui.QPixmap:
+        # Rasterize at device resolution so the cached glyphs stay sharp on
+        # high-DPI screens; the ratio is part of the cache key.
+        pixmap = QtGui.QPixmap(
+            max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio))
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        font = self.font()
+        metrics = self._font_metrics()
+        lines = self._text_layout()[0].split("\n")
+        rect = self.contentsRect()
+        alignment = self.alignment()
+        align = QtCore.Qt.AlignmentFlag
+        line_height = metrics.lineSpacing()
+        top = float(rect.top())
+        free_height = rect.height() - (metrics.height() + line_height * (len(lines) - 1))
+        if alignment & align.AlignVCenter:
+            top += free_height / 2
+        elif alignment & align.AlignBottom:
+            top += free_height
+        baseline = top + metrics.ascent()
+        path = QtGui.QPainterPath()
+        origins: list[tuple[QtCore.QPointF, str]] = []
+        for line in lines:
+            x = float(rect.left())
+            free_width = rect.width() - metrics.horizontalAdvance(line)
+            if alignment & align.AlignHCenter:
+                x += free_width / 2
+            elif alignment & align.AlignRight:
+                x += free_width
+            origin = QtCore.QPointF(x, baseline)
+            path.addText(origin, font, line)
+            origins.append((origin, line))
+            baseline += line_height
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        # One stroke along the glyph outlines, twice the outline width wide,
+        # replaces drawing the whole text again at every outline offset.
+        pen = QtGui.QPen(self._outline_color, 2 * self.OUTLINE_WIDTH)
+        pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
+        painter.strokePath(path, pen)
+        painter.setFont(font)
+        painter.setPen(fill)
+        for origin, line in origins:
+            painter.drawText(origin, line)
+        painter.end()
+        return pixmap
+
+
+@lru_cache(maxsize=4)
+def load_icon(path: str) -> QtGui.QIcon:
+    """Load the icon at *path* once; the tray and windows share it."""
+    return QtGui.QIcon(path)
+
+
+def set_label_text(label: QtWidgets.QLabel, text: str) -> bool:
+    """Set *text* on *label* if it differs; return whether it changed."""
+    if label.text() == text:
+        return False
+    label.setText(text)
+    return True
+
+
+def set_label_font(label: QtWidgets.QLabel, font: QtGui.QFont) -> bool:
+    """Set *font* on *label* if it differs; return whether it changed."""
+    if label.font() == font:
+        return False
+    label.setFont(font)
+    return True
+
+
+def set_label_color(label: QtWidgets.QLabel, color: str) -> bool:
+    """Set the text color of *label* if it differs; return whether it changed."""
+    role = QtGui.QPalette.ColorRole.WindowText
+    qcolor = QtGui.QColor(color)
+    palette = label.palette()
+    if palette.color(role) == qcolor:
+        return False
+    palette.setColor(role, qcolor)
+    label.setPalette(palette)
+    return True
 
 
 class TaskListDialog(QtDialogBase):
@@ -97,16 +331,29 @@ class TaskListDialog(QtDialogBase):
         self.refresh()
 
     def refresh(self) -> None:
-        self._list.clear()
-        for task in self.app.config.tasks:
-            item = QtWidgets.QListWidgetItem(self.app.format_task_list_item(task))
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, task.id)
-            if task.id == self.app.config.current_task_id:
+        # Rows are reused across refreshes; only changed texts, ids and fonts
+        # are written back, and surplus rows are dropped from the end.
+        tasks = self.app.config.tasks
+        current_id = self.app.config.current_task_id
+        id_role = QtCore.Qt.ItemDataRole.UserRole
+        while self._list.count() > len(tasks):
+            self._list.takeItem(self._list.count() - 1)
+        for row, task in enumerate(tasks):
+            item = self._list.item(row)
+            if item is None:
+                item = QtWidgets.QListWidgetItem()
+                self._list.addItem(item)
+            text = self.app.format_task_list_item(task)
+            if item.text() != text:
+                item.setText(text)
+            if item.data(id_role) != task.id:
+                item.setData(id_role, task.id)
+            is_current = task.id == current_id
+            if item.font().bold() != is_current:
                 font = item.font()
-                font.setBold(True)
+                font.setBold(is_current)
                 item.setFont(font)
-            self._list.addItem(item)
-            if task.id == self.app.config.current_task_id:
+            if is_current:
                 self._list.setCurrentItem(item)
         has_tasks = self._list.count() > 0
         self._list.setVisible(has_tasks)
@@ -159,6 +406,8 @@ class TaskListDialog(QtDialogBase):
 
 
 class TaskApp(QtWidgetBase):
+    _AUTOSTART_SCRIPT_NAME = "attention_autostart.bat"
+
     def __init__(self, config: TaskConfig, config_path: Path = CONFIG_FILE) -> None:
         if QtWidgets is None:
             raise SystemExit(
@@ -166,6 +415,13 @@ class TaskApp(QtWidgetBase):
             ) from _IMPORT_ERROR
         self.qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
         super().__init__()
+        self._tr_cache: dict[tuple[str, str], str] = {}
+        self._autostart_enabled_cache: bool | None = None
+        self._cached_autostart_command: str | None = None
+        self._cached_autostart_script: bytes | None = None
+        self._dispatcher = UiDispatcher(self)
+        self._save_lock = threading.Lock()
+        self._pending_save: bytes | None = None
         self._app_icon = self._load_app_icon()
         if not self._app_icon.isNull():
             self.qt_app.setWindowIcon(self._app_icon)
@@ -188,15 +444,23 @@ class TaskApp(QtWidgetBase):
         elif self.state.message in NO_TASK_VALUES:
             self.state.load_stored_task(None)
         self.setWindowTitle(self.tr("app_title"))
-        self.setWindowFlag(QtCore.Qt.WindowType.FramelessWindowHint)
-        self.setWindowFlag(QtCore.Qt.WindowType.WindowStaysOnTopHint)
+        self.setWindowFlags(
+            self.windowFlags()
+            | QtCore.Qt.WindowType.FramelessWindowHint
+            | QtCore.Qt.WindowType.WindowStaysOnTopHint
+        )
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.setWindowOpacity(self.state.transparency)
         self._drag_pos: Optional[QtCore.QPoint] = None
-
-        self._message_label = QtWidgets.QLabel(self.state.message)
-        self._time_label = QtWidgets.QLabel("")
-        self._estimate_label = QtWidgets.QLabel("")
+        self._pending_drag_pos: Optional[QtCore.QPoint] = None
+        self._drag_flush_scheduled = False
+        self._last_render_sig: tuple | None = None
+        self._last_menu_state: tuple | None = None
+        self._refresh_pending = False
+
+        self._message_label = OutlinedLabel(self.state.message)
+        self._time_label = OutlinedLabel("")
+        self._estimate_label = OutlinedLabel("")
         for lbl in (self._message_label, self._time_label, self._estimate_label):
             lbl.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
             lbl.setWordWrap(True)
@@ -211,6 +475,9 @@ class TaskApp(QtWidgetBase):
         layout.addWidget(self._time_label)
         layout.addSpacing(2)
         layout.addWidget(self._estimate_label)
+        # The window always takes the layout's size hint. Label changes post a
+        # deferred layout request instead of forcing a synchronous adjustSize.
+        layout.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetFixedSize)
         self.setLayout(layout)
 
         self._apply_font()
@@ -218,10 +485,21 @@ class TaskApp(QtWidgetBase):
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
 
-        self._timer = QtCore.QTimer(self)
-        self._timer.timeout.connect(self._refresh_labels)
-        self._timer.start(1000)
+        # Every timer owned by the window; _shutdown stops them all on quit.
+        self._timers: list[QtCore.QTimer] = []
+        # Single-shot: _refresh_labels re-arms it for the next text change.
+        self._timer = self._make_timer(1000, self._refresh_labels, single_shot=True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
 
+        self._persist_timer = self._make_timer(
+            GEOMETRY_SAVE_DELAY_MS, self._persist_config, single_shot=True
+        )
+        self.qt_app.aboutToQuit.connect(self._shutdown)
+
+        self._task_actions: dict[str, QtGui.QAction] = {}
+        self._tray_task_actions: dict[str, QtGui.QAction] = {}
+        self._tray_actions: dict[str, QtGui.QAction] = {}
+        self._task_menu = self._build_task_menu()
         self._tray = self._build_tray_icon()
         self._tray.show()
 
@@ -235,11 +513,22 @@ class TaskApp(QtWidgetBase):
         self.schedule_controller.start()
 
         self._restore_geometry()
-        self._refresh_ui()
+        self._commit_refresh()
 
     # Translation helper
     def tr(self, key: str, **kwargs: object) -> str:
-        return translate(self.state.language, key, **kwargs)
+        if kwargs:
+            # Formatted strings (e.g. the overlay's remaining time) change on
+            # every call; caching them would only evict the static ones.
+            return translate(self.state.language, key, **kwargs)
+        cache_key = (self.state.language, key)
+        text = self._tr_cache.get(cache_key)
+        if text is None:
+            if len(self._tr_cache) >= _TR_CACHE_LIMIT:
+                self._tr_cache.clear()
+            text = translate(self.state.language, key, **kwargs)
+            self._tr_cache[cache_key] = text
+        return text
 
     def _normalize_task_selection(self) -> None:
         task_ids = {task.id for task in self.config.tasks}
@@ -308,8 +597,19 @@ class TaskApp(QtWidgetBase):
         return f"{task.title} · {status}{suffix}"
 
     def _refresh_ui(self) -> None:
+        """Refresh labels and menus once the current event-loop pass ends.
+
+        Actions often trigger several refreshes in a row; they collapse into one.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QtCore.QTimer.singleShot(0, self._commit_refresh)
+
+    def _commit_refresh(self) -> None:
+        self._refresh_pending = False
         self._refresh_labels()
-        self._rebuild_tray_menu()
+        self._sync_menus()
 
     # Geometry persistence
     def _restore_geometry(self) -> None:
@@ -322,29 +622,46 @@ class TaskApp(QtWidgetBase):
     def _persist_geometry(self) -> None:
         self.config.x = self.x()
         self.config.y = self.y()
-        self._persist_config()
+        self._persist_timer.start()
+
+    def _flush_pending_persist(self) -> None:
+        if self._persist_timer.isActive():
+            self._persist_config()
+
+    def _make_timer(self, interval_ms: int, slot, single_shot: bool = False) -> QtCore.QTimer:
+        timer = QtCore.QTimer(self)
+        timer.setInterval(interval_ms)
+        timer.setSingleShot(single_shot)
+        timer.timeout.connect(slot)
+        self._timers.append(timer)
+        return timer
+
+    def _shutdown(self) -> None:
+        # Remove the tray icon first so it disappears as soon as quit is chosen.
+        self._tray.hide()
+        self._flush_pending_persist()
+        for timer in self._timers:
+            timer.stop()
+        self.schedule_controller.stop()
+        shutdown_background_executor()
 
     # Visual helpers
     def _apply_font(self) -> None:
-        font = QtGui.QFont(self.state.font_family, self.state.font_size)
-        bold_font = QtGui.QFont(font)
-        bold_font.setBold(True)
-        small_font = QtGui.QFont(font)
-        small_font.setPointSize(max(8, font.pointSize() - 4))
-        self._message_label.setFont(bold_font)
-        self._time_label.setFont(small_font)
-        self._estimate_label.setFont(small_font)
-
-        message_palette = self._message_label.palette()
-        message_palette.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(self.state.text_color))
-        self._message_label.setPalette(message_palette)
-        time_palette = self._time_label.palette()
-        time_palette.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(TIME_TEXT_COLOR))
-        self._time_label.setPalette(time_palette)
-
-        apply_outline_effect(self._message_label, self.state.outline_color)
-        apply_outline_effect(self._time_label, self.state.outline_color)
-        apply_outline_effect(self._estimate_label, self.state.outline_color)
+        family = self.state.font_family
+        size = self.state.font_size
+        bold_font = get_font(family, size, bold=True)
+        small_font = get_font(family, max(8, size - 4))
+        # Color- or opacity-only settings changes leave the fonts alone, so
+        # they cost a repaint rather than a relayout.
+        set_label_font(self._message_label, bold_font)
+        set_label_font(self._time_label, small_font)
+        set_label_font(self._estimate_label, small_font)
+
+        set_label_color(self._message_label, self.state.text_color)
+        set_label_color(self._time_label, TIME_TEXT_COLOR)
+
+        for label in (self._message_label, self._time_label, self._estimate_label):
+            label.set_outline_color(self.state.outline_color)
 
     def _should_autostart(self) -> bool:
         if self._current_task() is not None:
@@ -373,20 +690,42 @@ class TaskApp(QtWidgetBase):
 
     def _refresh_labels(self) -> None:
         self._autostart_if_needed()
-        self._message_label.setText(self.state.message)
-        message_palette = self._message_label.palette()
-        message_palette.setColor(
-            QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(self.state.text_color)
-        )
-        self._message_label.setPalette(message_palette)
-        self._time_label.setText(self.state.time_text())
+        self._schedule_label_refresh()
+        time_text = self.state.time_text()
         est_text, est_color = self.state.estimate_text()
-        self._estimate_label.setText(est_text)
-        est_palette = self._estimate_label.palette()
-        est_palette.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(est_color))
-        self._estimate_label.setPalette(est_palette)
-        self.adjustSize()
-        self._tray.setToolTip(self.state.message)
+        render_sig = (
+            self.state.message,
+            time_text,
+            est_text,
+            est_color,
+            self.state.text_color,
+            self.state.outline_color,
+            self.state.font_family,
+            self.state.font_size,
+        )
+        if render_sig == self._last_render_sig:
+            return
+        self._last_render_sig = render_sig
+        # Each label is only touched when its own text or color changed; the
+        # fixed-size layout resizes the window, if needed, in its next pass.
+        set_label_text(self._message_label, self.state.message)
+        set_label_color(self._message_label, self.state.text_color)
+        set_label_text(self._time_label, time_text)
+        set_label_text(self._estimate_label, est_text)
+        set_label_color(self._estimate_label, est_color)
+        # Each tooltip change is a round trip to the platform tray; the
+        # message changes far less often than the time line.
+        if self._tray.toolTip() != self.state.message:
+            self._tray.setToolTip(self.state.message)
+
+    def _schedule_label_refresh(self) -> None:
+        # The texts only change at minute or estimate boundaries, so wake up
+        # then instead of every second; nothing changes while paused or idle.
+        wait = self.state.seconds_until_text_change()
+        if wait is None:
+            self._timer.stop()
+        else:
+            self._timer.start(wait * 1000 + LABEL_REFRESH_SLACK_MS)
 
     # Context menu and tray
     def _build_tray_icon(self) -> QtWidgets.QSystemTrayIcon:
@@ -397,19 +736,50 @@ class TaskApp(QtWidgetBase):
         tray.setContextMenu(self._build_tray_menu())
         return tray
 
-    def _rebuild_tray_menu(self) -> None:
-        self._tray.setContextMenu(self._build_tray_menu())
+    def _sync_menus(self) -> None:
+        """Relabel and enable the persistent menu actions for the current state."""
+        has_task = self._current_task() is not None
+        menu_state = (
+            self.state.language,
+            has_task,
+            self.state.active,
+            self.state.paused,
+            self.isVisible(),
+            self._is_autostart_enabled(),
+        )
+        if menu_state == self._last_menu_state:
+            return
+        self._last_menu_state = menu_state
+        pause_key = "menu_resume" if self.state.paused else "menu_pause"
+        for actions in (self._task_actions, self._tray_task_actions):
+            actions["new"].setText(self.tr("menu_new"))
+            actions["edit"].setText(self.tr("menu_edit"))
+            actions["edit"].setEnabled(has_task)
+            actions["tasks"].setText(self.tr("menu_tasks"))
+            actions["pause"].setText(self.tr(pause_key))
+            actions["pause"].setEnabled(self.state.active)
+            actions["stop"].setText(self.tr("menu_stop"))
+            actions["stop"].setEnabled(has_task)
+        tray_actions = self._tray_actions
+        tray_actions["toggle"].setText(
+            self.tr("tray_hide") if self.isVisible() else self.tr("tray_show")
+        )
+        tray_actions["settings"].setText(self.tr("settings_title"))
+        tray_actions["schedule"].setText(self.tr("label_schedule_button"))
+        tray_actions["history"].setText(self.tr("menu_history"))
+        tray_actions["autostart"].setText(self.tr("tray_autostart"))
+        tray_actions["autostart"].setChecked(self._is_autostart_enabled())
+        tray_actions["quit"].setText(self.tr("tray_quit"))
 
     def _toggle_window_visibility(self) -> None:
         self.setVisible(not self.isVisible())
-        self._rebuild_tray_menu()
+        self._sync_menus()
 
     def _load_app_icon(self) -> QtGui.QIcon:
-        icon_path = Path(__file__).resolve().parent.parent / "icon.png"
-        return QtGui.QIcon(str(icon_path))
+        return load_icon(str(ICON_FILE))
 
     def _autostart_supported(self) -> bool:
-        return sys.platform.startswith("win")
+        return IS_WINDOWS
 
     def _startup_folder(self) -> Path | None:
         appdata = os.environ.get("APPDATA")
@@ -421,13 +791,18 @@ class TaskApp(QtWidgetBase):
         startup_folder = self._startup_folder()
         if startup_folder is None:
             return None
-        return startup_folder / "attention_autostart.bat"
+        return startup_folder / self._AUTOSTART_SCRIPT_NAME
 
     def _is_autostart_enabled(self) -> bool:
-        if not self._autostart_supported():
-            return False
-        script_path = self._autostart_script_path()
-        return script_path is not None and script_path.exists()
+        # Checked on every menu sync; only _set_autostart changes the answer.
+        if self._autostart_enabled_cache is None:
+            if not self._autostart_supported():
+                enabled = False
+            else:
+                script_path = self._autostart_script_path()
+                enabled = script_path is not None and script_path.exists()
+            self._autostart_enabled_cache = enabled
+        return self._autostart_enabled_cache
 
     def _resolve_python_executable(self) -> Path:
         python_exe = Path(sys.executable)
@@ -451,11 +826,18 @@ class TaskApp(QtWidgetBase):
         return [str(python_exe), str(script_path)]
 
     def _build_autostart_command(self) -> str | None:
+        # The interpreter, script and config paths are fixed for the process
+        # lifetime, so the resolved command is computed once.
+        if self._cached_autostart_command is not None:
+            return self._cached_autostart_command
         parts = self._resolve_autostart_command_parts()
         if not parts:
             return None
         parts.extend(["--config", str(self.config_path.resolve())])
-        return subprocess.list2cmdline(parts)
+        import subprocess
+
+        self._cached_autostart_command = subprocess.list2cmdline(parts)
+        return self._cached_autostart_command
 
     def _set_autostart(self, enabled: bool) -> bool:
         if not self._autostart_supported():
@@ -463,102 +845,123 @@ class TaskApp(QtWidgetBase):
         script_path = self._autostart_script_path()
         if script_path is None:
             return False
-        try:
-            if enabled:
-                command = self._build_autostart_command()
-                if not command:
-                    raise RuntimeError("Unable to determine launch command.")
-                script_path.parent.mkdir(parents=True, exist_ok=True)
-                script_path.write_text(
-                    "@echo off\n"
-                    f"start \"\" {command}\n",
-                    encoding="utf-8",
+        script: bytes | None = None
+        if enabled:
+            script = self._autostart_script_bytes()
+            if script is None:
+                self._show_autostart_error(
+                    RuntimeError("Unable to determine launch command."), enabled
                 )
-            elif script_path.exists():
-                script_path.unlink()
-            return True
-        except (OSError, RuntimeError) as exc:
-            QtWidgets.QMessageBox.critical(
-                self,
-                self.tr("notice_title"),
-                self.tr("error_autostart", error=str(exc)),
-            )
-            return False
+                return False
+        # The Startup folder may be on a slow or roaming profile; do the file
+        # I/O off the UI thread and only come back to report a failure.
+        self._autostart_enabled_cache = enabled
+        background_executor().submit(self._write_autostart, script_path, script, enabled)
+        return True
+
+    def _autostart_script_bytes(self) -> bytes | None:
+        # Encoded once alongside the cached command; toggles reuse the buffer.
+        if self._cached_autostart_script is None:
+            command = self._build_autostart_command()
+            if not command:
+                return None
+            self._cached_autostart_script = f"@echo off\nstart \"\" {command}\n".encode("utf-8")
+        return self._cached_autostart_script
+
+    def _write_autostart(self, script_path: Path, script: bytes | None, enabled: bool) -> None:
+        try:
+            if script is not None:
+                # The Startup folder nearly always exists; only create it
+                # when the first write says otherwise.
+                try:
+                    script_path.write_bytes(script)
+                except FileNotFoundError:
+                    script_path.parent.mkdir(parents=True, exist_ok=True)
+                    script_path.write_bytes(script)
+            else:
+                script_path.unlink(missing_ok=True)
+        except OSError as exc:
+            self._dispatcher.post_latest(self._show_autostart_error, exc, enabled)
+
+    def _show_autostart_error(self, exc: Exception, enabled: bool) -> None:
+        self._autostart_enabled_cache = None
+        actual = self._is_autostart_enabled()
+        if self._tray_actions:
+            self._tray_actions["autostart"].setChecked(actual)
+        if self.config.autostart != actual:
+            self.config.autostart = actual
+            self._persist_config()
+        QtWidgets.QMessageBox.critical(
+            self,
+            self.tr("notice_title"),
+            self.tr("error_autostart", error=str(exc)),
+        )
 
     def _handle_tray_activated(self, reason: QtWidgets.QSystemTrayIcon.ActivationReason) -> None:
         if reason == QtWidgets.QSystemTrayIcon.ActivationReason.Trigger:
             self._toggle_window_visibility()
 
+    def _add_task_actions(self, menu: QtWidgets.QMenu) -> dict[str, QtGui.QAction]:
+        actions = {
+            "new": menu.addAction(""),
+            "edit": menu.addAction(""),
+            "tasks": menu.addAction(""),
+            "pause": menu.addAction(""),
+            "stop": menu.addAction(""),
+        }
+        actions["new"].triggered.connect(self.start_task)
+        actions["edit"].triggered.connect(self._prompt_edit_message)
+        actions["tasks"].triggered.connect(self.show_task_list)
+        actions["pause"].triggered.connect(self.toggle_pause)
+        actions["stop"].triggered.connect(self.stop_task)
+        return actions
+
+    # Both menus are built once; _sync_menus updates their labels and state.
     def _build_task_menu(self) -> QtWidgets.QMenu:
         menu = QtWidgets.QMenu(self)
-        new_action = menu.addAction(self.tr("menu_new"))
-        new_action.triggered.connect(self.start_task)
-        has_task = self._current_task() is not None
-        edit_action = menu.addAction(self.tr("menu_edit"))
-        edit_action.triggered.connect(self._prompt_edit_message)
-        edit_action.setEnabled(has_task)
-        tasks_action = menu.addAction(self.tr("menu_tasks"))
-        tasks_action.triggered.connect(self.show_task_list)
-        pause_label = self.tr("menu_resume") if self.state.paused else self.tr("menu_pause")
-        pause_action = menu.addAction(pause_label)
-        pause_action.triggered.connect(self.toggle_pause)
-        pause_action.setEnabled(self.state.active)
-        stop_action = menu.addAction(self.tr("menu_stop"))
-        stop_action.triggered.connect(self.stop_task)
-        stop_action.setEnabled(has_task)
+        self._task_actions = self._add_task_actions(menu)
         return menu
 
     def _build_tray_menu(self) -> QtWidgets.QMenu:
         menu = QtWidgets.QMenu(self)
-        toggle_action = menu.addAction(
-            self.tr("tray_hide") if self.isVisible() else self.tr("tray_show")
-        )
+        toggle_action = menu.addAction("")
         toggle_action.triggered.connect(self._toggle_window_visibility)
         menu.addSeparator()
-        new_action = menu.addAction(self.tr("menu_new"))
-        new_action.triggered.connect(self.start_task)
-        edit_action = menu.addAction(self.tr("menu_edit"))
-        edit_action.triggered.connect(self._prompt_edit_message)
-        edit_action.setEnabled(self._current_task() is not None)
-        tasks_action = menu.addAction(self.tr("menu_tasks"))
-        tasks_action.triggered.connect(self.show_task_list)
-        pause_label = self.tr("menu_resume") if self.state.paused else self.tr("menu_pause")
-        pause_action = menu.addAction(pause_label)
-        pause_action.triggered.connect(self.toggle_pause)
-        pause_action.setEnabled(self.state.active)
-        stop_action = menu.addAction(self.tr("menu_stop"))
-        stop_action.triggered.connect(self.stop_task)
-        stop_action.setEnabled(self._current_task() is not None)
+        self._tray_task_actions = self._add_task_actions(menu)
         menu.addSeparator()
-        settings_action = menu.addAction(self.tr("settings_title"))
+        settings_action = menu.addAction("")
         settings_action.triggered.connect(self.open_settings)
-        schedule_action = menu.addAction(self.tr("label_schedule_button"))
+        schedule_action = menu.addAction("")
         schedule_action.triggered.connect(lambda: self._open_schedule_manager(self))
-        history_action = menu.addAction(self.tr("menu_history"))
+        history_action = menu.addAction("")
         history_action.triggered.connect(self.show_history)
-        autostart_action = menu.addAction(self.tr("tray_autostart"))
+        autostart_action = menu.addAction("")
         autostart_action.setCheckable(True)
-        autostart_action.setChecked(self._is_autostart_enabled())
         autostart_action.triggered.connect(self._toggle_autostart)
         if not self._autostart_supported():
             autostart_action.setEnabled(False)
         menu.addSeparator()
-        quit_action = menu.addAction(self.tr("tray_quit"))
+        quit_action = menu.addAction("")
         quit_action.triggered.connect(QtWidgets.QApplication.quit)
+        self._tray_actions = {
+            "toggle": toggle_action,
+            "settings": settings_action,
+            "schedule": schedule_action,
+            "history": history_action,
+            "autostart": autostart_action,
+            "quit": quit_action,
+        }
         return menu
 
     def _toggle_autostart(self, checked: bool) -> None:
         if not self._set_autostart(checked):
-            action = self.sender()
-            if isinstance(action, QtGui.QAction):
-                action.setChecked(self._is_autostart_enabled())
+            self._tray_actions["autostart"].setChecked(self._is_autostart_enabled())
             return
         self.config.autostart = checked
         self._persist_config()
 
     def _show_context_menu(self, pos: QtCore.QPoint) -> None:
-        menu = self._build_task_menu()
-        menu.exec(self.mapToGlobal(pos))
+        self._task_menu.exec(self.mapToGlobal(pos))
 
     # Events
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:  # noqa: N802
@@ -569,13 +972,25 @@ class TaskApp(QtWidgetBase):
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:  # noqa: N802
         if self._drag_pos is not None and event.buttons() & QtCore.Qt.MouseButton.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            # High-rate mice deliver many moves per frame; only the latest
+            # position is applied, once the event queue drains.
+            self._pending_drag_pos = event.globalPosition().toPoint() - self._drag_pos
+            if not self._drag_flush_scheduled:
+                self._drag_flush_scheduled = True
+                QtCore.QTimer.singleShot(0, self._flush_drag)
             event.accept()
         super().mouseMoveEvent(event)
 
+    def _flush_drag(self) -> None:
+        self._drag_flush_scheduled = False
+        if self._pending_drag_pos is not None:
+            self.move(self._pending_drag_pos)
+            self._pending_drag_pos = None
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:  # noqa: N802
         if event.button() == QtCore.Qt.MouseButton.LeftButton and self._drag_pos is not None:
             self._drag_pos = None
+            self._flush_drag()
             self._persist_geometry()
         super().mouseReleaseEvent(event)
 
@@ -586,8 +1001,9 @@ class TaskApp(QtWidgetBase):
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
         event.ignore()
+        self._flush_pending_persist()
         self.hide()
-        self._rebuild_tray_menu()
+        self._sync_menus()
 
     # Actions
     def start_task(self, parent: QtWidgets.QWidget | None = None) -> bool:
@@ -728,16 +1144,30 @@ class TaskApp(QtWidgetBase):
         self._persist_config()
         self._refresh_ui()
 
+    def _run_in_background(self, func, callback, *args: object) -> None:
+        """Run ``func(*args)`` on the worker thread and pass its result to *callback* here.
+
+        If *func* raises, the error is logged and *callback* gets an empty
+        list, so the widgets waiting on it are still filled in.
+        """
+
+        def work() -> None:
+            try:
+                result = func(*args)
+            except Exception:
+                _log.exception("Background task %s failed", getattr(func, "__name__", func))
+                result = []
+            self._dispatcher.post(callback, result)
+
+        background_executor().submit(work)
+
     # History dialog
     def show_history(self) -> None:
-        history = load_history()
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle(self.tr("history_title"))
         layout = QtWidgets.QVBoxLayout(dialog)
 
-        dates = sorted(history.keys(), reverse=True)
         combo = QtWidgets.QComboBox(dialog)
-        combo.addItems(dates)
         layout.addWidget(combo)
 
         table = QtWidgets.QTableWidget(dialog)
@@ -751,23 +1181,43 @@ class TaskApp(QtWidgetBase):
         )
         layout.addWidget(table)
 
-        def render_date(date_key: str) -> None:
-            records = history.get(date_key, [])
-            table.setRowCount(len(records) or 1)
-            if not records:
-                table.setItem(0, 0, QtWidgets.QTableWidgetItem(""))
-                table.setItem(0, 1, QtWidgets.QTableWidgetItem(self.tr("history_empty")))
-                table.setItem(0, 2, QtWidgets.QTableWidgetItem(""))
-                return
-            for row, record in enumerate(records):
-                table.setItem(row, 0, QtWidgets.QTableWidgetItem(record.timestamp))
-                table.setItem(row, 1, QtWidgets.QTableWidgetItem(record.event))
-                table.setItem(row, 2, QtWidgets.QTableWidgetItem(record.title))
-            table.resizeColumnsToContents()
+        def render_date(date_key: str, records: list[TaskRecord]) -> None:
+            if combo.currentText() != date_key:
+                return  # another date was picked while this one loaded
+            if records:
+                labels = event_labels(self.state.language)
+                rows = [
+                    (
+                        time_of_day(record.timestamp),
+                        labels.get(record.event, record.event),
+                        record.title,
+                    )
+                    for record in records
+                ]
+            else:
+                rows = [("", self.tr("history_empty"), "")]
+            # Fill the table with repaints suspended so a long day lays out once.
+            table.setUpdatesEnabled(False)
+            try:
+                table.clearContents()
+                table.setRowCount(len(rows))
+                for row, values in enumerate(rows):
+                    for column, value in enumerate(values):
+                        table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+                if records:
+                    table.resizeColumnsToContents()
+            finally:
+                table.setUpdatesEnabled(True)
+
+        def load_date(date_key: str) -> None:
+            if date_key:
+                self._run_in_background(
+                    load_records_for_date, partial(render_date, date_key), date_key
+                )
 
-        if dates:
-            render_date(dates[0])
-        combo.currentTextChanged.connect(render_date)
+        # Adding the dates selects the newest, which loads its records.
+        combo.currentTextChanged.connect(load_date)
+        self._run_in_background(history_dates, combo.addItems)
 
         close_btn = QtWidgets.QPushButton(self.tr("history_close"))
         close_btn.clicked.connect(dialog.close)
@@ -778,22 +1228,25 @@ class TaskApp(QtWidgetBase):
 
     # Settings and schedule
     def open_settings(self) -> None:
+        # Imported on first use; most sessions never open the settings dialog.
+        from .settings import SettingsDialog
+
         self._save_current_task_state()
         config_copy = copy.deepcopy(self.config)
         dialog = SettingsDialog(config_copy, self.tr, self._open_schedule_manager, self)
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
-        updated = dialog.apply_changes()
-        if not updated:
-            return
-        self._apply_config(updated)
+        self._apply_config(dialog.apply_changes())
         self._persist_config()
         self._refresh_ui()
 
     def _apply_config(self, new_config: TaskConfig) -> None:
         self.config = new_config
         self._normalize_task_selection()
-        self.state.language = ensure_language(new_config.language, self.state.language)
+        language = ensure_language(new_config.language, self.state.language)
+        if language != self.state.language:
+            self._tr_cache.clear()
+        self.state.language = language
         self.state.font_family = new_config.font_family
         self.state.font_size = ensure_font_size(new_config.font_size, self.state.font_size)
         self.state.outline_color = ensure_color(new_config.outline_color, self.state.outline_color)
@@ -809,42 +1262,64 @@ class TaskApp(QtWidgetBase):
             self.state.text_color = ensure_color(new_config.text_color, self.state.text_color)
         self.schedule_controller.set_font(self.state.font_family, self.state.font_size)
         sanitized_schedule = self.schedule_controller.set_schedule(new_config.schedule)
-        self.config.schedule = [asdict(entry) for entry in sanitized_schedule]
+        self.config.schedule = [entry._asdict() for entry in sanitized_schedule]
         self.schedule_controller.start()
         self.setWindowOpacity(self.state.transparency)
         self.setWindowTitle(self.tr("app_title"))
         self._apply_font()
 
     def _open_schedule_manager(self, parent: QtWidgets.QWidget | None = None) -> None:
+        from .settings import SettingsDialog
+
         entries = self.schedule_controller.open_manager(parent)
         target_config: TaskConfig = self.config
         if isinstance(parent, SettingsDialog):
             target_config = parent.config
-        target_config.schedule = [asdict(entry) for entry in entries]
+        target_config.schedule = [entry._asdict() for entry in entries]
         self.schedule_controller.set_schedule(target_config.schedule)
         if parent is None or not isinstance(parent, SettingsDialog):
             self._persist_config()
 
     # Config helpers
     def _persist_config(self) -> None:
+        self._persist_timer.stop()
+        self._save_current_task_state()
+        self.config.language = self.state.language
+        self.config.text_color = self.state.text_color
+        self.config.outline_color = self.state.outline_color
+        self.config.transparency = self.state.transparency
+        self.config.font_family = self.state.font_family
+        self.config.font_size = self.state.font_size
+        self.config.message = self.state.message
+        self.config.schedule = [entry._asdict() for entry in self.schedule_controller.entries]
+        # Encode here, where the config is consistent, and write on the worker.
+        # Saves queued behind a slow write collapse into the newest payload.
+        payload = self.config.encode()
+        with self._save_lock:
+            write_queued = self._pending_save is not None
+            self._pending_save = payload
+        if not write_queued:
+            background_executor().submit(self._write_pending_config)
+
+    def _write_pending_config(self) -> None:
+        with self._save_lock:
+            payload, self._pending_save = self._pending_save, None
+        if payload is None:
+            return
         try:
-            self._save_current_task_state()
-            self.config.language = self.state.language
-            self.config.text_color = self.state.text_color
-            self.config.outline_color = self.state.outline_color
-            self.config.transparency = self.state.transparency
-            self.config.font_family = self.state.font_family
-            self.config.font_size = self.state.font_size
-            self.config.message = self.state.message
-            self.config.schedule = [asdict(entry) for entry in self.schedule_controller.entries]
-            self.config.save(self.config_path)
+            write_config(self.config_path, payload)
         except OSError as exc:  # pragma: no cover - fs issues
-            QtWidgets.QMessageBox.critical(
-                self,
-                self.tr("notice_title"),
-                self.tr("error_save", error=str(exc)),
-            )
+            self._dispatcher.post_latest(self._show_save_error, exc)
+
+    def _show_save_error(self, exc: OSError) -> None:
+        QtWidgets.QMessageBox.critical(
+            self,
+            self.tr("notice_title"),
+            self.tr("error_save", error=str(exc)),
+        )
 
     def run(self) -> None:
-        self.show()
+        # __init__ already showed the window via _restore_geometry.
+        if not self.isVisible():
+            self.show()
         self.qt_app.exec()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+try:  # pragma: no cover - import guard to allow headless testing
+    from PyQt6 import QtCore
+except Exception:  # pragma: no cover - handled by the UI modules
+    QtCore = None  # type: ignore[assignment]
+
+QtObjectBase = QtCore.QObject if QtCore is not None else object
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def background_executor() -> ThreadPoolExecutor:
+    """Return the shared single-thread executor for blocking work off the UI thread."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="attention-worker")
+    return _executor
+
+
+def shutdown_background_executor() -> None:
+    """Stop accepting work; a task already running finishes on its own thread."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+class UiDispatcher(QtObjectBase):
+    """Queue callables from any thread to run on the thread that owns this object."""
+
+    if QtCore is not None:
+        _invoke = QtCore.pyqtSignal(object)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._invoke.connect(self._run, QtCore.Qt.ConnectionType.QueuedConnection)
+        self._latest: dict[Callable[..., Any], tuple[Any, ...]] = {}
+        self._latest_lock = threading.Lock()
+
+    def post(self, callback: Callable[..., Any], *args: Any) -> None:
+        self._invoke.emit(partial(callback, *args))
+
+    def post_latest(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Like ``post``, but while *callback* is queued, later posts only replace its args."""
+        with self._latest_lock:
+            queued = callback in self._latest
+            self._latest[callback] = args
+        if not queued:
+            self._invoke.emit(partial(self._run_latest, callback))
+
+    def _run_latest(self, callback: Callable[..., Any]) -> None:
+        with self._latest_lock:
+            args = self._latest.pop(callback)
+        callback(*args)
+
+    def _run(self, callback: Callable[[], Any]) -> None:
+        callback()
@@ -1,31 +1,65 @@
 from __future__ import annotations
 
-import argparse
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import NoReturn
 
 from attention import CONFIG_FILE, TaskApp, TaskConfig
 
+# Three flags do not need argparse; a plain loop keeps it off the startup
+# path while matching its help text and exit codes.
+_USAGE = "usage: {prog} [-h] [--text TEXT] [--config CONFIG] [--no-persist]"
+_HELP = """{usage}
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Floating always-on-top task window with system tray controls.",
-    )
-    parser.add_argument(
-        "--text",
-        help="Task text to display for this session.",
-    )
-    parser.add_argument(
-        "--config",
-        default=str(CONFIG_FILE),
-        help="Path to the JSON configuration file.",
-    )
-    parser.add_argument(
-        "--no-persist",
-        action="store_true",
-        help="Do not write the provided --text into the configuration.",
-    )
-    return parser.parse_args(argv)
+Floating always-on-top task window with system tray controls.
+
+options:
+  -h, --help       show this help message and exit
+  --text TEXT      Task text to display for this session.
+  --config CONFIG  Path to the JSON configuration file.
+  --no-persist     Do not write the provided --text into the configuration.
+"""
+_VALUE_OPTIONS = {"--text": "text", "--config": "config"}
+
+
+def _prog() -> str:
+    return os.path.basename(sys.argv[0]) or "floating_task.py"
+
+
+def _usage() -> str:
+    return _USAGE.format(prog=_prog())
+
+
+def _usage_error(message: str) -> NoReturn:
+    sys.stderr.write(f"{_usage()}\n{_prog()}: error: {message}\n")
+    raise SystemExit(2)
+
+
+def parse_args(argv: list[str]) -> SimpleNamespace:
+    args = SimpleNamespace(text=None, config=str(CONFIG_FILE), no_persist=False)
+    unrecognized: list[str] = []
+    remaining = iter(argv)
+    for arg in remaining:
+        if arg in ("-h", "--help"):
+            sys.stdout.write(_HELP.format(usage=_usage()))
+            raise SystemExit(0)
+        if arg == "--no-persist":
+            args.no_persist = True
+            continue
+        name, sep, value = arg.partition("=")
+        if name in _VALUE_OPTIONS:
+            if not sep:
+                value = next(remaining, None)
+                if value is None or value.startswith("--"):
+                    _usage_error(f"argument {name}: expected one argument")
+            setattr(args, _VALUE_OPTIONS[name], value)
+            continue
+        unrecognized.append(arg)
+    if unrecognized:
+        _usage_error(f"unrecognized arguments: {' '.join(unrecognized)}")
+    return args
 
 
 def run_app(argv: list[str]) -> None:
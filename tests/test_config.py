@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import json
+from dataclasses import fields
 from datetime import datetime
 
-from attention.config import TaskConfig
+from attention import storage
+from attention.config import (
+    TaskConfig,
+    ensure_schedule,
+    is_valid_color,
+    normalize_time,
+    time_to_minutes,
+)
 from attention.task_state import StoredTask
 
 
@@ -51,3 +59,117 @@ def test_task_config_migrates_legacy_message_to_task(tmp_path) -> None:
     assert len(loaded.tasks) == 1
     assert loaded.tasks[0].title == "Legacy task"
     assert loaded.current_task_id == loaded.tasks[0].id
+
+
+def test_task_config_load_returns_independent_copies(tmp_path) -> None:
+    path = tmp_path / "config.json"
+    TaskConfig(message="Cached", x=10, y=20).save(path)
+
+    first = TaskConfig.load(path)
+    first.tasks.append(StoredTask(title="Mutated"))
+    second = TaskConfig.load(path)
+
+    assert second.x == 10
+    assert all(task.title != "Mutated" for task in second.tasks)
+
+
+def test_task_config_load_sees_saved_changes(tmp_path) -> None:
+    path = tmp_path / "config.json"
+    TaskConfig(x=10, y=20).save(path)
+    assert TaskConfig.load(path).x == 10
+
+    TaskConfig(x=30, y=20).save(path)
+
+    assert TaskConfig.load(path).x == 30
+
+
+def test_ensure_schedule_normalizes_and_rejects_times() -> None:
+    schedule = ensure_schedule(
+        [
+            {"start": "9:05", "end": "10:00", "label": "Standup"},
+            {"start": "24:00", "end": "25:00", "label": "Invalid"},
+            {"start": "12:60", "end": "13:00", "label": "Invalid"},
+            {"start": "12:00", "end": "12:00", "label": "Empty"},
+            {"start": "1200", "end": "13:00", "label": "Invalid"},
+        ]
+    )
+
+    assert schedule == [{"start": "09:05", "end": "10:00", "label": "Standup"}]
+
+
+def test_is_valid_color() -> None:
+    assert is_valid_color("#A1b2C3")
+    assert is_valid_color(" #000000 ")
+    assert not is_valid_color("#12345")
+    assert not is_valid_color("#12345g")
+    assert not is_valid_color("123456")
+    assert not is_valid_color("#123456\n#")
+    assert not is_valid_color(None)
+
+
+def test_task_config_save_leaves_no_temp_file(tmp_path) -> None:
+    path = tmp_path / "config.json"
+
+    TaskConfig(message="Atomic").save(path)
+
+    assert [entry.name for entry in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_task_config_load_falls_back_for_invalid_style_fields(tmp_path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "font_size": 500,
+                "text_color": "red",
+                "outline_color": "#ABCDEF",
+                "transparency": "opaque",
+                "language": "ZH",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    loaded = TaskConfig.load(path)
+
+    assert loaded.font_size == 96
+    assert loaded.text_color == TaskConfig().text_color
+    assert loaded.outline_color == "#abcdef"
+    assert loaded.transparency == TaskConfig().transparency
+    assert loaded.language == "zh"
+
+
+def test_task_config_save_skips_unchanged_payload(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "config.json"
+    writes: list[bytes] = []
+    original = storage.atomic_write_bytes
+
+    def counting_write(target, data):
+        writes.append(data)
+        original(target, data)
+
+    monkeypatch.setattr(storage, "atomic_write_bytes", counting_write)
+    config = TaskConfig(font_size=20)
+
+    config.save(path)
+    config.save(path)
+    TaskConfig.load(path).save(path)
+    config.x = 5
+    config.save(path)
+
+    assert len(writes) == 2
+
+
+def test_time_helpers_parse_hour_minute() -> None:
+    assert normalize_time("9:5") == "09:05"
+    assert normalize_time("24:00") is None
+    assert time_to_minutes("13:30") == 13 * 60 + 30
+    assert time_to_minutes(" 7:00 ") == 7 * 60
+    assert time_to_minutes("7h") is None
+    assert time_to_minutes(None) is None
+
+
+def test_task_config_encode_covers_every_field() -> None:
+    data = json.loads(TaskConfig().encode())
+
+    assert list(data) == [item.name for item in fields(TaskConfig)]
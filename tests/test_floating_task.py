@@ -0,0 +1,37 @@
+import pytest
+
+from attention import CONFIG_FILE
+from floating_task import parse_args
+
+
+def test_parse_args_defaults() -> None:
+    args = parse_args([])
+
+    assert args.text is None
+    assert args.config == str(CONFIG_FILE)
+    assert args.no_persist is False
+
+
+def test_parse_args_accepts_separate_and_inline_values() -> None:
+    args = parse_args(["--text", "Write docs", "--config=custom.json", "--no-persist"])
+
+    assert args.text == "Write docs"
+    assert args.config == "custom.json"
+    assert args.no_persist is True
+
+
+@pytest.mark.parametrize("argv", [["--bogus"], ["--text"], ["--config", "--no-persist"]])
+def test_parse_args_rejects_bad_usage(argv, capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(argv)
+
+    assert excinfo.value.code == 2
+    assert "usage:" in capsys.readouterr().err
+
+
+def test_parse_args_help_exits_cleanly(capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["--help"])
+
+    assert excinfo.value.code == 0
+    assert "--no-persist" in capsys.readouterr().out
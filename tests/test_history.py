@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime
+
+from attention import history as history_module
+from attention.history import (
+    FLUSH_THRESHOLD,
+    ISO_FORMAT,
+    TaskRecord,
+    append_record,
+    flush_pending,
+    history_dates,
+    load_history,
+    load_records_for_date,
+    save_history,
+    time_of_day,
+)
+
+
+def test_append_record_writes_one_line_per_event(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+
+    append_record(TaskRecord("2026-03-16T09:30:00", "start", "Write docs"), path)
+    append_record(TaskRecord("2026-03-16T09:45:00", "pause", "Write docs"), path)
+    flush_pending(path)
+
+    lines = path.read_bytes().splitlines()
+    assert len(lines) == 2
+    history = load_history(path)
+    records = [record for records in history.values() for record in records]
+    assert [record.event for record in records] == ["start", "pause"]
+    assert records[0].title == "Write docs"
+
+
+def test_save_and_load_history_round_trip(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+    history = {
+        "2026-03-15": [TaskRecord("2026-03-15T10:00:00", "start", "Plan")],
+        "2026-03-16": [
+            TaskRecord("2026-03-16T08:00:00", "start", "Review"),
+            TaskRecord("2026-03-16T08:30:00", "stop", "Review"),
+        ],
+    }
+
+    save_history(history, path)
+
+    assert load_history(path) == history
+
+
+def test_load_history_skips_corrupt_lines(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+    path.write_text(
+        '{"date": "2026-03-16", "timestamp": "2026-03-16T08:00:00", "event": "start", "title": "A"}\n'
+        "not json\n"
+        '{"date": "2026-03-16", "event": "stop"}\n',
+        encoding="utf-8",
+    )
+
+    history = load_history(path)
+
+    assert list(history) == ["2026-03-16"]
+    assert len(history["2026-03-16"]) == 1
+
+
+def test_legacy_history_is_migrated(tmp_path) -> None:
+    legacy_path = tmp_path / "history.json"
+    legacy_path.write_text(
+        json.dumps(
+            {
+                "2026-03-16": [
+                    {"timestamp": "2026-03-16T08:00:00", "event": "start", "title": "Legacy"}
+                ]
+            },
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    path = tmp_path / "history.jsonl"
+
+    history = load_history(path)
+
+    assert history["2026-03-16"][0].title == "Legacy"
+    assert path.exists()
+    assert len(path.read_bytes().splitlines()) == 1
+
+
+def test_record_timestamp_and_date_match_datetime() -> None:
+    before = datetime.now()
+    record = TaskRecord.create("start", "Clock")
+    after = datetime.now()
+
+    parsed = datetime.strptime(record.timestamp, ISO_FORMAT)
+    assert before.replace(microsecond=0) <= parsed <= after
+    assert history_module._today() in {before.strftime("%Y-%m-%d"), after.strftime("%Y-%m-%d")}
+
+
+def test_append_record_buffers_until_flushed(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+
+    append_record(TaskRecord("2026-03-16T09:30:00", "start", "Buffered"), path)
+
+    assert not path.exists()
+    records = [record for records in load_history(path).values() for record in records]
+    assert [record.title for record in records] == ["Buffered"]
+
+
+def test_append_record_flushes_at_threshold(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+
+    for index in range(FLUSH_THRESHOLD):
+        append_record(TaskRecord("2026-03-16T09:30:00", "start", f"Task {index}"), path)
+
+    assert len(path.read_bytes().splitlines()) == FLUSH_THRESHOLD
+
+
+def test_history_dates_and_records_for_date(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+    save_history(
+        {
+            "2026-03-15": [TaskRecord("2026-03-15T10:00:00", "start", "2026-03-16 notes")],
+            "2026-03-16": [TaskRecord("2026-03-16T08:00:00", "start", "Review")],
+        },
+        path,
+    )
+
+    assert history_dates(path) == ["2026-03-16", "2026-03-15"]
+    records = load_records_for_date("2026-03-16", path)
+    assert [record.title for record in records] == ["Review"]
+    assert load_records_for_date("2026-01-01", path) == []
+    assert history_dates(tmp_path / "missing.jsonl") == []
+
+
+def test_task_record_is_immutable_and_hashable() -> None:
+    record = TaskRecord("2026-03-16T08:00:00", "start", "Review")
+
+    assert not hasattr(record, "__dict__")
+    assert {record, TaskRecord("2026-03-16T08:00:00", "start", "Review")} == {record}
+
+
+def test_time_of_day_slices_iso_timestamps() -> None:
+    assert time_of_day("2026-03-16T08:05:09") == "08:05:09"
+    assert time_of_day("yesterday") == "yesterday"
+
+
+def test_day_index_picks_up_new_records(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+    save_history({"2026-03-15": [TaskRecord("2026-03-15T10:00:00", "start", "Plan")]}, path)
+    assert history_dates(path) == ["2026-03-15"]
+    assert len(load_records_for_date("2026-03-15", path)) == 1
+
+    line = history_module._encode_line("2026-03-16", TaskRecord("2026-03-16T08:00:00", "stop", "Plan"))
+    with path.open("ab") as handle:
+        handle.write(line)
+
+    assert history_dates(path) == ["2026-03-16", "2026-03-15"]
+    assert [record.event for record in load_records_for_date("2026-03-16", path)] == ["stop"]
+
+
+def test_record_appended_during_timed_flush_reaches_disk(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "history.jsonl"
+    monkeypatch.setattr(history_module, "FLUSH_INTERVAL_SECONDS", 0.01)
+    # Keep a timer left over from an earlier test from flushing on our behalf.
+    if history_module._flush_timer is not None:
+        history_module._flush_timer.cancel()
+        history_module._flush_timer = None
+    real_fsync = history_module.os.fsync
+    appended = threading.Event()
+
+    def fsync_and_append(fd: int) -> None:
+        # Runs inside the timer's flush, after the first batch was taken.
+        real_fsync(fd)
+        if not appended.is_set():
+            appended.set()
+            append_record(TaskRecord("2026-03-16T09:31:00", "stop", "Late"), path)
+
+    monkeypatch.setattr(history_module.os, "fsync", fsync_and_append)
+    append_record(TaskRecord("2026-03-16T09:30:00", "start", "Early"), path)
+
+    deadline = time.monotonic() + 5
+    lines: list[bytes] = []
+    while time.monotonic() < deadline:
+        lines = path.read_bytes().splitlines() if path.exists() else []
+        if len(lines) == 2:
+            break
+        time.sleep(0.01)
+    assert [json.loads(line)["title"] for line in lines] == ["Early", "Late"]
+
+
+def test_failing_timed_flush_backs_off_and_logs_once(tmp_path, monkeypatch, caplog) -> None:
+    path = tmp_path / "missing" / "history.jsonl"
+    monkeypatch.setattr(history_module, "_pending", {})
+    monkeypatch.setattr(history_module, "_flush_failures", 0)
+    delays: list[float | None] = []
+    monkeypatch.setattr(
+        history_module, "_schedule_flush", lambda delay=None: delays.append(delay)
+    )
+    append_record(TaskRecord("2026-03-16T09:30:00", "start", "Write docs"), path)
+
+    for _ in range(12):
+        history_module._timed_flush()
+
+    assert delays[:4] == [
+        None,
+        history_module.FLUSH_INTERVAL_SECONDS * 2,
+        history_module.FLUSH_INTERVAL_SECONDS * 4,
+        history_module.FLUSH_INTERVAL_SECONDS * 8,
+    ]
+    assert delays[-1] == history_module.FLUSH_MAX_BACKOFF_SECONDS
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 1
+    history_module._flush_at_exit()
+
+    path.parent.mkdir()
+    history_module._timed_flush()
+    assert history_module._flush_failures == 0
+    assert len(path.read_bytes().splitlines()) == 1
+
+
+def test_pending_records_are_capped_while_writes_fail(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "missing" / "history.jsonl"
+    monkeypatch.setattr(history_module, "_pending", {})
+    monkeypatch.setattr(history_module, "_flush_failures", 1)
+    monkeypatch.setattr(history_module, "MAX_PENDING_RECORDS", 3)
+    monkeypatch.setattr(history_module, "_schedule_flush", lambda delay=None: None)
+    for minute in range(5):
+        append_record(TaskRecord(f"2026-03-16T09:3{minute}:00", "start", str(minute)), path)
+
+    history_module._timed_flush()
+
+    titles = [json.loads(line)["title"] for line in history_module._pending[path]]
+    assert titles == ["2", "3", "4"]
@@ -0,0 +1,37 @@
+import pytest
+
+from attention.i18n import event_labels, get_strings, strip_pause_prefix, translate
+
+
+def test_strip_pause_prefix_handles_every_language() -> None:
+    for language in ("en", "zh"):
+        prefix = translate(language, "pause_prefix")
+        assert strip_pause_prefix(f"{prefix} Write docs") == "Write docs"
+
+
+def test_strip_pause_prefix_leaves_plain_text() -> None:
+    assert strip_pause_prefix("Write docs") == "Write docs"
+
+
+def test_translate_formats_only_templates_with_placeholders() -> None:
+    assert translate("en", "estimate_label", minutes=5) == "Estimated 5 min"
+    assert translate("en", "menu_pause") == "Pause Task"
+    assert translate("en", "missing_key") == "missing_key"
+
+
+def test_get_strings_is_read_only() -> None:
+    strings = get_strings("en")
+
+    assert strings is get_strings("en")
+    assert get_strings("unknown") is strings
+    with pytest.raises(TypeError):
+        strings["no_task"] = "changed"  # type: ignore[index]
+
+
+def test_event_labels_map_raw_events() -> None:
+    labels = event_labels("en")
+
+    assert labels["start"] == translate("en", "history_event_start")
+    assert event_labels("zh")["stop"] == translate("zh", "history_event_stop")
+    assert event_labels("unknown") is labels
+    assert labels.get("custom", "custom") == "custom"
@@ -0,0 +1,84 @@
+from attention.schedule import ScheduleEntry, index_schedule, match_entry
+
+
+def _minutes(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _match(entries: list[ScheduleEntry], at: str) -> tuple[str | None, str | None]:
+    kept, starts, reach = index_schedule(entries)
+    active, upcoming = match_entry(starts, reach, _minutes(at))
+    return (
+        kept[active].label if active is not None else None,
+        kept[upcoming].label if upcoming is not None else None,
+    )
+
+
+DAY = [
+    ScheduleEntry("Lunch", "12:00", "13:00"),
+    ScheduleEntry("Standup", "09:00", "09:15"),
+    ScheduleEntry("Review", "13:00", "13:30"),
+]
+
+
+def test_index_schedule_sorts_and_computes_reach() -> None:
+    entries, starts, reach = index_schedule(DAY)
+    assert [entry.label for entry in entries] == ["Standup", "Lunch", "Review"]
+    assert starts == [540, 720, 780]
+    assert reach == [555, 780, 810]
+
+
+def test_match_entry_before_the_first_entry() -> None:
+    assert _match(DAY, "08:00") == (None, "Standup")
+
+
+def test_match_entry_after_the_last_entry() -> None:
+    assert _match(DAY, "13:30") == (None, None)
+    assert _match(DAY, "23:59") == (None, None)
+
+
+def test_match_entry_between_entries() -> None:
+    assert _match(DAY, "09:15") == (None, "Lunch")
+
+
+def test_match_entry_back_to_back_entries() -> None:
+    assert _match(DAY, "12:59") == ("Lunch", None)
+    assert _match(DAY, "13:00") == ("Review", None)
+
+
+def test_match_entry_overlapping_entries() -> None:
+    entries = [
+        ScheduleEntry("Long", "10:00", "12:00"),
+        ScheduleEntry("Short", "10:30", "11:00"),
+        ScheduleEntry("Late", "11:30", "12:30"),
+    ]
+    assert _match(entries, "10:45") == ("Long", None)
+    # The first entry still running wins, even when a later one started.
+    assert _match(entries, "11:45") == ("Long", None)
+    assert _match(entries, "12:00") == ("Late", None)
+    assert _match(entries, "12:30") == (None, None)
+
+
+def test_match_entry_after_a_nested_entry_ends() -> None:
+    entries = [
+        ScheduleEntry("Short", "10:00", "10:30"),
+        ScheduleEntry("Long", "10:15", "11:00"),
+        ScheduleEntry("Later", "11:30", "12:00"),
+    ]
+    assert _match(entries, "10:45") == ("Long", None)
+    assert _match(entries, "11:00") == (None, "Later")
+
+
+def test_index_schedule_drops_unparseable_entries() -> None:
+    entries = [
+        ScheduleEntry("Broken", "25:00", "26:00"),
+        ScheduleEntry("Empty", "", "10:00"),
+        ScheduleEntry("Backwards", "11:00", "10:00"),
+        ScheduleEntry("Zero", "10:00", "10:00"),
+        ScheduleEntry("Break", "10:00", "10:15"),
+    ]
+    kept, starts, reach = index_schedule(entries)
+    assert [entry.label for entry in kept] == ["Break"]
+    assert (starts, reach) == ([600], [615])
+    assert _match(entries, "00:00") == (None, "Break")
@@ -1,9 +1,10 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 import pytest
 
+from attention import task_state as task_state_module
 from attention.i18n import translate
-from attention.task_state import TaskState
+from attention.task_state import TaskState, elapsed_label, estimate_color
 
 
 @pytest.fixture
@@ -63,3 +64,122 @@ def test_store_and_restore_task_snapshot(state: TaskState) -> None:
     assert restored.task_name() == "Deep Work"
     assert restored.active is True
     assert restored.estimate_minutes == 45
+
+
+def test_estimate_color_boundaries() -> None:
+    assert estimate_color(0, 600) == "#4caf50"
+    assert estimate_color(300, 600) == "#4caf50"
+    assert estimate_color(301, 600) == "#ffeb3b"
+    assert estimate_color(480, 600) == "#ffeb3b"
+    assert estimate_color(600, 600) == "#ff9800"
+    assert estimate_color(601, 600) == "#ff3b30"
+
+
+def test_time_text_follows_start_time_changes(state: TaskState) -> None:
+    state.start("Clock")
+    state.start_time = state.start_time.replace(hour=9, minute=5, second=7)  # type: ignore[union-attr]
+    assert state.time_text().endswith("09:05:07")
+    state.start_time = state.start_time.replace(hour=14)
+    assert state.time_text().endswith("14:05:07")
+
+
+@pytest.mark.parametrize("estimate_minutes", [None, 1, 3])
+def test_seconds_until_text_change_matches_next_change(
+    state: TaskState, monkeypatch: pytest.MonkeyPatch, estimate_minutes
+) -> None:
+    state.start("Focus", estimate_minutes=estimate_minutes)
+    current = {"elapsed": 0}
+    monkeypatch.setattr(state, "elapsed_seconds", lambda: current["elapsed"])
+    for elapsed in range(0, 400):
+        current["elapsed"] = elapsed
+        text = state.estimate_text()
+        wait = state.seconds_until_text_change()
+        expected = 1
+        current["elapsed"] = elapsed + 1
+        while state.estimate_text() == text:
+            expected += 1
+            current["elapsed"] = elapsed + expected
+        current["elapsed"] = elapsed
+        assert wait == expected, elapsed
+
+
+def test_seconds_until_text_change_is_none_while_paused(state: TaskState) -> None:
+    assert state.seconds_until_text_change() is None
+    state.start("Focus")
+    assert state.seconds_until_text_change() is not None
+    state.pause()
+    assert state.seconds_until_text_change() is None
+
+
+@pytest.fixture
+def clocks(monkeypatch: pytest.MonkeyPatch) -> dict[str, float]:
+    """Fake monotonic and wall clocks, advanced independently by the test."""
+    clock = {"monotonic": 1000.0, "wall": 0.0}
+    base = datetime(2026, 3, 16, 9, 0, 0)
+
+    class FakeDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):  # type: ignore[override]
+            return base + timedelta(seconds=clock["wall"])
+
+    monkeypatch.setattr(task_state_module.time, "monotonic", lambda: clock["monotonic"])
+    monkeypatch.setattr(task_state_module, "datetime", FakeDateTime)
+    return clock
+
+
+def _advance(clock: dict[str, float], seconds: float) -> None:
+    clock["monotonic"] += seconds
+    clock["wall"] += seconds
+
+
+def test_elapsed_seconds_follows_the_monotonic_clock(
+    state: TaskState, clocks: dict[str, float]
+) -> None:
+    state.start("Focus")
+    assert state.elapsed_seconds() == 0
+
+    _advance(clocks, 125.5)
+    assert state.elapsed_seconds() == 125
+    state.pause()
+    _advance(clocks, 600)
+    assert state.elapsed_seconds() == 125
+    state.resume()
+    _advance(clocks, 10)
+    assert state.elapsed_seconds() == 135
+
+
+def test_small_wall_clock_adjustments_are_ignored(
+    state: TaskState, clocks: dict[str, float]
+) -> None:
+    state.start("Focus")
+    _advance(clocks, 60)
+    clocks["wall"] -= 2
+    assert state.elapsed_seconds() == 60
+
+
+def test_elapsed_seconds_counts_time_asleep(state: TaskState, clocks: dict[str, float]) -> None:
+    state.start("Focus")
+    _advance(clocks, 60)
+    assert state.elapsed_seconds() == 60
+    # Monotonic time stands still while suspended; the wall clock does not.
+    clocks["wall"] += 3600
+    assert state.elapsed_seconds() == 3660
+    _advance(clocks, 5)
+    assert state.elapsed_seconds() == 3665
+
+
+def test_reloaded_task_keeps_its_elapsed_time(state: TaskState, clocks: dict[str, float]) -> None:
+    state.start("Focus")
+    _advance(clocks, 90)
+    stored = state.to_stored_task("task-1")
+
+    reloaded = TaskState(language="en")
+    reloaded.load_stored_task(stored)
+    assert reloaded.elapsed_seconds() == state.elapsed_seconds() == 90
+
+
+def test_elapsed_label_formats_whole_minutes() -> None:
+    assert elapsed_label("en", 0) == translate("en", "time_elapsed_less_minute")
+    assert elapsed_label("en", 5) == "Elapsed 5 minutes"
+    assert elapsed_label("en", 120) == "Elapsed 2 hours"
+    assert elapsed_label("en", 125) == "Elapsed 2h 5m"
@@ -0,0 +1,13 @@
+from attention import workers
+
+
+def test_background_executor_is_recreated_after_shutdown():
+    executor = workers.background_executor()
+    assert workers.background_executor() is executor
+    assert executor.submit(lambda: 42).result(timeout=5) == 42
+
+    workers.shutdown_background_executor()
+    replacement = workers.background_executor()
+    assert replacement is not executor
+    assert replacement.submit(lambda: "ok").result(timeout=5) == "ok"
+    workers.shutdown_background_executor()